@@ -0,0 +1,156 @@
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from decimal import Decimal
+
+from ingest import parse_expense
+from splitter import BillSplitter
+
+# Groups sent to a worker process in one task. Most groups settle in microseconds, so
+# sending them one by one would spend more time on pickling and queues than on work.
+CHUNK_SIZE = 64
+
+class GroupResult:
+    # The outcome of settling one group. transactions is the Settlement from
+    # minimize_transactions, or None when the group failed; error then says why.
+    # seconds is the time spent on this group inside the worker.
+    def __init__(self, group_id, transactions, seconds, error=None):
+        self.group_id = group_id
+        self.transactions = transactions
+        self.seconds = seconds
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        outcome = f"{len(self.transactions)} transfers" if self.ok else f"error={self.error!r}"
+        return f"GroupResult({self.group_id!r}, {outcome}, {self.seconds * 1000:.2f} ms)"
+
+def settle_group(group_id, expenses, method="greedy", time_budget=1.0):
+    # Settles one group from its expense records (see ingest.parse_expense). Any error in
+    # the group is returned in the result instead of being raised, so one broken group
+    # never stops the others.
+    start = time.perf_counter()
+    try:
+        splitter = BillSplitter()
+        for record in expenses:
+            if isinstance(record, Exception):
+                raise record
+            splitter.add_expense_units(*parse_expense(record))
+        transactions = splitter.minimize_transactions(method, time_budget)
+    except Exception as error:
+        return GroupResult(group_id, None, time.perf_counter() - start, f"{type(error).__name__}: {error}")
+    return GroupResult(group_id, transactions, time.perf_counter() - start)
+
+def _settle_chunk(chunk, method, time_budget):
+    # Runs in a worker process.
+    return [settle_group(group_id, expenses, method, time_budget) for group_id, expenses in chunk]
+
+def _chunks(groups, size):
+    chunk = []
+    for group in groups:
+        chunk.append(tuple(group))
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _chunk_results(future, chunk):
+    # The results of a finished chunk. When the worker itself failed (e.g. a group could
+    # not be pickled or the process died), every group of the chunk is reported as failed.
+    try:
+        return future.result()
+    except Exception as error:
+        message = f"{type(error).__name__}: {error}"
+        return [GroupResult(group_id, None, 0.0, message) for group_id, _ in chunk]
+
+def settle_groups(groups, workers=None, method="greedy", time_budget=1.0, ordered=False,
+                  chunk_size=CHUNK_SIZE, max_in_flight=None):
+    # Settles many independent groups on a pool of worker processes and yields a
+    # GroupResult per group. groups is any iterable of (group_id, expenses) and is read
+    # lazily: at most max_in_flight chunks (default: 2 per worker) are queued or running
+    # at any time, so memory does not depend on the number of groups. Results come in
+    # completion order, or in input order when ordered is True. workers defaults to the
+    # number of CPUs; workers=0 settles everything in this process.
+    #
+    # A worker process that dies (crash, os._exit, out of memory) breaks the whole pool:
+    # the chunks in flight at that moment are reported as failed, a new pool is started
+    # and the remaining groups are settled on it.
+    if workers is None:
+        workers = os.cpu_count() or 1
+    chunks = _chunks(groups, chunk_size)
+    if workers == 0:
+        for chunk in chunks:
+            yield from _settle_chunk(chunk, method, time_budget)
+        return
+    if max_in_flight is None:
+        max_in_flight = 2 * workers
+    pool = ProcessPoolExecutor(workers)
+    try:
+        pending = deque()  # (future, chunk) in submission order
+        chunk = next(chunks, None)
+        while chunk is not None or pending:
+            broken = False
+            while chunk is not None and len(pending) < max_in_flight:
+                try:
+                    future = pool.submit(_settle_chunk, chunk, method, time_budget)
+                except BrokenProcessPool:
+                    broken = True
+                    break
+                pending.append((future, chunk))
+                chunk = next(chunks, None)
+            if broken or ordered:
+                done = [pending.popleft()] if pending else []
+            else:
+                finished, _ = wait([future for future, _ in pending], return_when=FIRST_COMPLETED)
+                done = [item for item in pending if item[0] in finished]
+                for item in done:
+                    pending.remove(item)
+            for future, done_chunk in done:
+                yield from _chunk_results(future, done_chunk)
+                broken = broken or isinstance(future.exception(), BrokenProcessPool)
+            if broken:
+                # Every future of a broken pool finishes, with its result or with
+                # BrokenProcessPool, so the rest of the chunks in flight are reported
+                # before the pool is replaced. A chunk that was not submitted yet is
+                # kept and sent to the new pool.
+                while pending:
+                    yield from _chunk_results(*pending.popleft())
+                pool.shutdown()
+                pool = ProcessPoolExecutor(workers)
+    finally:
+        pool.shutdown()
+
+def read_groups(path):
+    # Yields (group_id, expenses) from a JSON Lines file with one group per line:
+    # {"group": ..., "expenses": [{"payer": ..., "amount": ..., "participants": [...]}, ...]}.
+    with open(path, encoding="utf-8") as file:
+        for line_number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                group = json.loads(line, parse_float=Decimal)
+                group_id, expenses = group.get("group", line_number), group["expenses"]
+            except (ValueError, KeyError, AttributeError) as error:
+                group_id, expenses = line_number, [error]
+            yield group_id, expenses
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit("usage: python batch.py GROUPS.jsonl")
+    start = time.perf_counter()
+    settled = failed = 0
+    for result in settle_groups(read_groups(sys.argv[1])):
+        if result.ok:
+            settled += 1
+        else:
+            failed += 1
+            print(f"{result.group_id}: {result.error}")
+    print(f"{settled} groups settled, {failed} failed, {time.perf_counter() - start:.2f} s")
@@ -1,49 +1,15 @@
 import streamlit as st
-from collections import defaultdict
 
-class BillSplitter:
-    def __init__(self):
-        self.balances = defaultdict(int)
-
-    def add_expense(self, payer, amount, participants):
-        if not participants:
-            st.warning("Պետք է նշել մասնակիցներին։")
-            return
-        share = amount / len(participants)
-        for person in participants:
-            if person != payer:
-                self.balances[person] -= share
-                self.balances[payer] += share
-    
-    def minimize_transactions(self):
-        creditors = sorted([(creditor, balance) for creditor, balance in self.balances.items() if balance > 0], key=lambda x: -x[1])
-        debtors = sorted([(debtor, balance) for debtor, balance in self.balances.items() if balance < 0], key=lambda x: x[1])
-        transactions = []
-        i, j = 0, 0
-
-        while len(creditors) != 0:
-            debtor, debt = debtors[0]
-            creditor, credit = creditors[0]
-
-            transfer_amount = min(-debt, credit)
-            transactions.append((debtor, creditor, transfer_amount))
-
-            self.balances[debtor] += transfer_amount
-            self.balances[creditor] -= transfer_amount
-
-            creditors = sorted([(p, b) for p, b in self.balances.items() if b > 0], key=lambda x: -x[1])
-            debtors = sorted([(p, b) for p, b in self.balances.items() if b < 0], key=lambda x: x[1])
-        return transactions
-
-
-    def get_balances(self):
-        return self.balances
+from splitter import MINOR_UNITS, Ledger
 
 st.title("💰 Bill Splitter")
 st.write("Հաշիվների բաշխման համակարգ")
 
-if "expenses" not in st.session_state:
-    st.session_state["expenses"] = []
+# The ledger keeps the running balances, so adding, editing or deleting an expense only
+# touches that expense's participants, and settlements are cached until the next change.
+if "ledger" not in st.session_state:
+    st.session_state["ledger"] = Ledger()
+ledger = st.session_state["ledger"]
 
 payer = st.text_input("Վճարող:")
 amount = st.number_input("Գումար:", min_value=0.0, format="%.2f")
@@ -52,22 +18,42 @@ participants = [p.strip() for p in participants if p.strip()]
 
 if st.button("Ավելացնել ծախս"):
     if payer and amount > 0 and participants:
-        st.session_state["expenses"].append((payer, amount, participants))
+        ledger.add_expense(payer, amount, participants)
         st.success("Ծախսը հաջողությամբ ավելացվեց")
     else:
         st.error("Խնդրում ենք լրացնել բոլոր տվյալները")
 
+if ledger.expenses:
+    st.subheader("🧾 Ծախսեր")
+for expense_id, (old_payer, units, old_participants) in list(ledger.expenses.items()):
+    with st.expander(f"{old_payer}: {units / MINOR_UNITS:.2f} AMD ({', '.join(old_participants)})"):
+        new_payer = st.text_input("Վճարող:", old_payer, key=f"payer_{expense_id}")
+        new_amount = st.number_input("Գումար:", min_value=0.0, value=units / MINOR_UNITS,
+                                     format="%.2f", key=f"amount_{expense_id}")
+        new_participants = st.text_input("Մասնակիցներ:", ", ".join(old_participants),
+                                         key=f"participants_{expense_id}").split(",")
+        new_participants = [p.strip() for p in new_participants if p.strip()]
+        save, delete = st.columns(2)
+        if save.button("Պահպանել", key=f"save_{expense_id}"):
+            if new_payer and new_amount > 0 and new_participants:
+                ledger.edit_expense(expense_id, new_payer, new_amount, new_participants)
+                st.rerun()
+            else:
+                st.error("Խնդրում ենք լրացնել բոլոր տվյալները")
+        if delete.button("Ջնջել", key=f"delete_{expense_id}"):
+            ledger.delete_expense(expense_id)
+            st.rerun()
+
+optimal = st.checkbox("Գտնել փոխանցումների նվազագույն քանակը (մինչև ~20 մասնակից)")
+
 if st.button("Հաշվել պարտքերը"):
-    splitter = BillSplitter()
-    for payer, amount, participants in st.session_state["expenses"]:
-        splitter.add_expense(payer, amount, participants)
-    
     st.subheader("📊 Հաշվեկշիռներ")
-    balances = splitter.get_balances()
+    balances = ledger.get_balances()
     for person, balance in balances.items():
         st.write(f"{person}: {balance:.2f} AMD")
-    
+
     st.subheader("💰 Նվազագույն փոխանցումներ")
-    transactions = splitter.minimize_transactions()
+    transactions = ledger.minimize_transactions("optimal" if optimal else "greedy")
     for debtor, creditor, amount in transactions:
         st.write(f"{debtor} → {creditor}: {amount:.2f} AMD")
+    st.caption(f"Մեթոդ՝ {transactions.method}" + (f" ({transactions.note})" if transactions.note else ""))
@@ -0,0 +1,127 @@
+import csv
+import json
+import sys
+import time
+from decimal import Decimal
+
+from splitter import BillSplitter, to_minor
+
+# Only this many row errors are kept in a report (all of them are counted), so a broken
+# file cannot make the report grow without bound.
+MAX_ERRORS = 1000
+
+class IngestReport:
+    def __init__(self):
+        self.rows = 0
+        self.loaded = 0
+        self.failed = 0
+        self.errors = []  # (row, message) of the first MAX_ERRORS failures
+        self.seconds = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        return (f"{self.loaded}/{self.rows} rows loaded, {self.failed} failed, "
+                f"{self.seconds:.2f} s ({self.rows_per_second:,.0f} rows/s)")
+
+def parse_participants(value):
+    # A list of names, or one string with names separated by commas (as in the UI).
+    if isinstance(value, str):
+        value = value.split(",")
+    return [person.strip() for person in value if person.strip()]
+
+def parse_expense(record):
+    # Returns (payer, amount in minor units, participants) from a mapping with the keys
+    # payer, amount and participants, or from a (payer, amount, participants) sequence.
+    # Raises ValueError with a readable message for a bad row.
+    if isinstance(record, dict):
+        missing = [key for key in ("payer", "amount", "participants") if record.get(key) in (None, "")]
+        if missing:
+            raise ValueError(f"missing {', '.join(missing)}")
+        payer, amount, participants = record["payer"], record["amount"], record["participants"]
+    else:
+        if len(record) != 3:
+            raise ValueError(f"expected 3 fields, got {len(record)}")
+        payer, amount, participants = record
+    payer = str(payer).strip()
+    if not payer:
+        raise ValueError("missing payer")
+    try:
+        units = to_minor(amount)
+    except (ArithmeticError, ValueError):
+        raise ValueError(f"invalid amount {amount!r}") from None
+    if units <= 0:
+        raise ValueError(f"amount must be positive, got {amount!r}")
+    participants = parse_participants(participants)
+    if not participants:
+        raise ValueError("no participants")
+    return payer, units, participants
+
+def read_csv(path):
+    # Yields (line number, row dict) from a CSV file with a payer,amount,participants header.
+    with open(path, newline="", encoding="utf-8") as file:
+        reader = csv.DictReader(file)
+        for row in reader:
+            yield reader.line_num, row
+
+def read_jsonl(path):
+    # Yields (line number, object) from a JSON Lines file. Amounts are parsed as Decimal,
+    # so no float rounding happens before the conversion to minor units.
+    with open(path, encoding="utf-8") as file:
+        for line_number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, json.loads(line, parse_float=Decimal)
+            except json.JSONDecodeError as error:
+                yield line_number, error
+
+def read_file(path):
+    # Picks the reader from the file extension (.jsonl/.ndjson, anything else is CSV).
+    if str(path).endswith((".jsonl", ".ndjson")):
+        return read_jsonl(path)
+    return read_csv(path)
+
+def ingest(records, splitter=None, max_errors=MAX_ERRORS, numbered=False):
+    # Adds every expense from records to splitter, one row at a time, so memory does not
+    # depend on the number of rows. records yields expense records (see parse_expense),
+    # or (row number, record) pairs from the readers above when numbered is True. Bad
+    # rows are counted and reported, and the load continues. Returns (splitter, report).
+    if splitter is None:
+        splitter = BillSplitter()
+    report = IngestReport()
+    add = splitter.add_expense_units
+    if not numbered:
+        records = enumerate(records, 1)
+    start = time.perf_counter()
+    for row, record in records:
+        report.rows += 1
+        try:
+            if isinstance(record, Exception):
+                raise ValueError(str(record))
+            add(*parse_expense(record))
+        except (ValueError, TypeError) as error:
+            report.failed += 1
+            if len(report.errors) < max_errors:
+                report.errors.append((row, str(error)))
+        else:
+            report.loaded += 1
+    report.seconds = time.perf_counter() - start
+    return splitter, report
+
+def ingest_file(path, splitter=None, max_errors=MAX_ERRORS):
+    return ingest(read_file(path), splitter, max_errors, numbered=True)
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        sys.exit("usage: python ingest.py EXPENSES.csv|EXPENSES.jsonl ...")
+    splitter = BillSplitter()
+    for path in sys.argv[1:]:
+        _, report = ingest_file(path, splitter)
+        print(f"{path}: {report}")
+        for row, message in report.errors[:20]:
+            print(f"  row {row}: {message}")
+    for debtor, creditor, amount in splitter.minimize_transactions():
+        print(f"{debtor} → {creditor}: {amount:.2f} AMD")
@@ -0,0 +1,248 @@
+import heapq
+import time
+from array import array
+from collections import defaultdict
+from decimal import Decimal, ROUND_HALF_UP
+
+# Balances are kept in integer minor units (1 AMD = 100 luma), so every sum is exact
+# and settlement always ends with all balances at zero.
+MINOR_UNITS = 100
+
+# The exact solver keeps two tables of 2**n entries (9 bytes each) and does about
+# n * 2**(n-1) steps, so it is only attempted for up to this many people (after removing
+# settled people and pairs that cancel out). 20 people take about 2 s and 9 MB.
+MAX_EXACT_PEOPLE = 20
+
+def to_minor(amount):
+    return int((Decimal(str(amount)) * MINOR_UNITS).to_integral_value(ROUND_HALF_UP))
+
+def split_shares(total, participants):
+    # Splits total minor units over participants. The first `remainder` participants pay
+    # one unit more, so the shares add up to total exactly and the split is deterministic.
+    share, remainder = divmod(total, len(participants))
+    return [(person, share + (index < remainder)) for index, person in enumerate(participants)]
+
+def settle(balances):
+    # Greedy settlement: the largest debtor always pays the largest creditor as much as
+    # possible (ties go to whoever appears first in balances). Both sides live in heaps,
+    # so n people take O(n log n) instead of re-sorting after every transfer. The input
+    # is not modified. Returns (debtor, creditor, amount) in the units of balances.
+    creditors = [(-balance, order, person) for order, (person, balance) in enumerate(balances.items()) if balance > 0]
+    debtors = [(balance, order, person) for order, (person, balance) in enumerate(balances.items()) if balance < 0]
+    heapq.heapify(creditors)
+    heapq.heapify(debtors)
+    transactions = []
+    while creditors and debtors:
+        debt, debtor_order, debtor = debtors[0]
+        credit, creditor_order, creditor = creditors[0]
+        transfer_amount = min(-debt, -credit)
+        transactions.append((debtor, creditor, transfer_amount))
+        if transfer_amount == -debt:
+            heapq.heappop(debtors)
+        else:
+            heapq.heapreplace(debtors, (debt + transfer_amount, debtor_order, debtor))
+        if transfer_amount == -credit:
+            heapq.heappop(creditors)
+        else:
+            heapq.heapreplace(creditors, (credit + transfer_amount, creditor_order, creditor))
+    return transactions
+
+class Settlement(list):
+    # The (debtor, creditor, amount) transfers produced by a solver, as a plain list, plus
+    # how they were found. method is "optimal" when the exact search finished and
+    # "greedy" otherwise; note says why the exact search was not used.
+    def __init__(self, transactions, method, seconds, note=None):
+        super().__init__(transactions)
+        self.method = method
+        self.seconds = seconds
+        self.note = note
+
+def _zero_sum_groups(people, values, deadline):
+    # Bitmask dynamic programming over all subsets: groups[mask] is the largest number of
+    # zero-sum groups that the people in mask can be split into, built from the results
+    # for every mask with one person fewer. Returns the groups of the best split, or None
+    # when the deadline passes first. The first 4096 masks (4096 + 12 * 2048 units of
+    # work, counting one per mask and one per person in it) time the loop, and the search
+    # stops right there if the rest cannot finish before the deadline.
+    size = 1 << len(values)
+    sums = array("q", bytes(8 * size))
+    groups = bytearray(size)
+    start = time.perf_counter()
+    for mask in range(1, size):
+        if not mask & 4095:
+            now = time.perf_counter()
+            if now > deadline:
+                return None
+            if mask == 4096 and now + (now - start) * (size * (len(values) + 2) / 2 / 28672 - 1) > deadline:
+                return None
+        low = mask & -mask
+        total = sums[mask] = sums[mask ^ low] + values[low.bit_length() - 1]
+        best = 0
+        rest = mask
+        while rest:
+            bit = rest & -rest
+            if groups[mask ^ bit] > best:
+                best = groups[mask ^ bit]
+            rest ^= bit
+        groups[mask] = best + (total == 0)
+    # Walk back from the full set along masks that keep the optimum, then cut the
+    # resulting order wherever the running sum returns to zero.
+    order = []
+    mask = size - 1
+    while mask:
+        target = groups[mask] - (sums[mask] == 0)
+        rest = mask
+        while True:
+            bit = rest & -rest
+            if groups[mask ^ bit] == target:
+                break
+            rest ^= bit
+        order.append(bit.bit_length() - 1)
+        mask ^= bit
+    result, current, total = [], [], 0
+    for index in reversed(order):
+        current.append(people[index])
+        total += values[index]
+        if total == 0:
+            result.append(current)
+            current = []
+    return result
+
+def settle_optimal(balances, time_budget=1.0):
+    # Finds the minimum number of transfers. Each zero-sum group of k people needs exactly
+    # k - 1 transfers, so the optimum splits everyone into as many zero-sum groups as
+    # possible. Two people whose balances cancel out always form a group of their own;
+    # the remaining people go through _zero_sum_groups. If there are more than
+    # MAX_EXACT_PEOPLE of them, or time_budget seconds pass, the greedy result is
+    # returned instead. Each group is settled with settle(). Returns a Settlement.
+    start = time.perf_counter()
+    people = [person for person, balance in balances.items() if balance]
+    if sum(balances[person] for person in people):
+        raise ValueError("Balances must add up to zero.")
+    position = {person: index for index, person in enumerate(people)}
+    groups, waiting, remaining = [], defaultdict(list), []
+    for person in people:
+        partners = waiting[-balances[person]]
+        if partners:
+            partner = partners.pop(0)
+            remaining.remove(partner)
+            groups.append([partner, person])
+        else:
+            waiting[balances[person]].append(person)
+            remaining.append(person)
+    note = None
+    if len(remaining) > MAX_EXACT_PEOPLE:
+        note = f"{len(remaining)} people exceed the exact solver limit of {MAX_EXACT_PEOPLE}"
+    elif remaining:
+        found = _zero_sum_groups(remaining, [balances[person] for person in remaining], start + time_budget)
+        if found is None:
+            note = f"time budget of {time_budget} s exceeded"
+        else:
+            groups.extend(found)
+    if note is not None:
+        return Settlement(settle(balances), "greedy", time.perf_counter() - start, note)
+    groups.sort(key=lambda group: min(position[person] for person in group))
+    transactions = []
+    for group in groups:
+        transactions.extend(settle({person: balances[person] for person in sorted(group, key=position.get)}))
+    return Settlement(transactions, "optimal", time.perf_counter() - start)
+
+class BillSplitter:
+    def __init__(self):
+        self.balances = defaultdict(int)  # minor units
+
+    def add_expense(self, payer, amount, participants):
+        return self.add_expense_units(payer, to_minor(amount), participants)
+
+    def add_expense_units(self, payer, units, participants):
+        # Same as add_expense with the amount already in minor units.
+        if not participants:
+            raise ValueError("Պետք է նշել մասնակիցներին։")
+        balances = self.balances
+        for person, owed in split_shares(units, participants):
+            if person != payer:
+                balances[person] -= owed
+                balances[payer] += owed
+    
+    def minimize_transactions(self, method="greedy", time_budget=1.0):
+        # method="optimal" runs the exact solver (see settle_optimal) within time_budget
+        # seconds. The Settlement reports which method produced the transfers (in AMD).
+        if method == "optimal":
+            result = settle_optimal(self.balances, time_budget)
+        elif method == "greedy":
+            start = time.perf_counter()
+            result = Settlement(settle(self.balances), "greedy", time.perf_counter() - start)
+        else:
+            raise ValueError(f"Unknown method {method!r}; expected 'greedy' or 'optimal'.")
+        result[:] = [(debtor, creditor, amount / MINOR_UNITS) for debtor, creditor, amount in result]
+        return result
+
+    def get_balances(self):
+        return {person: balance / MINOR_UNITS for person, balance in self.balances.items()}
+
+class Ledger(BillSplitter):
+    # A BillSplitter that remembers its expenses by id. Adding, editing or deleting an
+    # expense updates the running balances with that expense's deltas only, in
+    # O(participants), instead of replaying the whole history. Settlements are cached
+    # per ledger version and recomputed only after a change.
+    def __init__(self):
+        super().__init__()
+        self.expenses = {}  # id -> (payer, amount in minor units, participants)
+        self.version = 0
+        self._next_id = 0
+        self._mentions = defaultdict(int)  # person -> number of balance entries they take part in
+        self._settlements = (0, {})
+
+    def _apply(self, payer, units, participants, sign):
+        # Adds (sign=1) or reverses (sign=-1) the balance deltas of one expense. A person
+        # no longer mentioned by any expense is dropped, as a full replay would.
+        balances = self.balances
+        mentions = self._mentions
+        for person, owed in split_shares(units, participants):
+            if person == payer:
+                continue
+            balances[person] -= sign * owed
+            balances[payer] += sign * owed
+            for name in (person, payer):
+                mentions[name] += sign
+                if not mentions[name]:
+                    del mentions[name]
+                    del balances[name]
+
+    def add_expense_units(self, payer, units, participants):
+        # Records the expense and returns its id.
+        if not participants:
+            raise ValueError("Պետք է նշել մասնակիցներին։")
+        participants = list(participants)
+        expense_id = self._next_id
+        self._next_id += 1
+        self.expenses[expense_id] = (payer, units, participants)
+        self._apply(payer, units, participants, 1)
+        self.version += 1
+        return expense_id
+
+    def edit_expense(self, expense_id, payer, amount, participants):
+        units = to_minor(amount)
+        if not participants:
+            raise ValueError("Պետք է նշել մասնակիցներին։")
+        participants = list(participants)
+        self._apply(*self.expenses[expense_id], -1)
+        self.expenses[expense_id] = (payer, units, participants)
+        self._apply(payer, units, participants, 1)
+        self.version += 1
+
+    def delete_expense(self, expense_id):
+        self._apply(*self.expenses.pop(expense_id), -1)
+        self.version += 1
+
+    def minimize_transactions(self, method="greedy", time_budget=1.0):
+        version, cache = self._settlements
+        if version != self.version:
+            cache = {}
+            self._settlements = (self.version, cache)
+        key = (method, time_budget)
+        if key not in cache:
+            cache[key] = super().minimize_transactions(method, time_budget)
+        result = cache[key]
+        # A copy, so a caller changing the list does not change the cached result.
+        return Settlement(result, result.method, result.seconds, result.note)
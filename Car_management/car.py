@@ -1,70 +1,356 @@
+import math
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from functools import partial
+from itertools import chain, islice
 from typing import List
+from uuid import uuid4
 
 # --------------------- Base Classes ---------------------
+def new_car_id() -> str:
+    # 17 random hex digits, as long as a VIN. They come from uuid4 rather than a counter,
+    # so IDs made in different processes or runs do not repeat.
+    return uuid4().hex[:17].upper()
+
 class Car:
-    def __init__(self, make: str, model: str, price: float):
+    # __slots__ instead of a per-instance __dict__ keeps large fleets small in memory.
+    __slots__ = ("car_id", "make", "model", "price")
+
+    def __init__(self, make: str, model: str, price: float, car_id: str = None):
         if not isinstance(make, str) or not isinstance(model, str):
             raise TypeError("Make and model must be strings.")
         if not isinstance(price, (int, float)) or price <= 0:
             raise ValueError("Price must be a positive number.")
         
+        if car_id is None:
+            car_id = new_car_id()
+        elif not isinstance(car_id, str):
+            raise TypeError("Car ID must be a string.")
+
+        self.car_id = car_id
         self.make = make
         self.model = model
         self.price = price
 
+    @property
+    def car_type(self):
+        return type(self)
+
     def __str__(self):
         return f"{self.make} {self.model} - ${self.price}"
 
 # Specialized Cars
 class ElectricCar(Car):
-    def __init__(self, make, model, price, battery_capacity, charging_time):
-        super().__init__(make, model, price)
+    __slots__ = ("battery_capacity", "charging_time")
+
+    def __init__(self, make, model, price, battery_capacity, charging_time, car_id=None):
+        super().__init__(make, model, price, car_id)
         if battery_capacity <= 0 or charging_time <= 0:
             raise ValueError("Battery capacity and charging time must be positive numbers.")
         self.battery_capacity = battery_capacity
         self.charging_time = charging_time
 
 class HybridCar(Car):
-    def __init__(self, make, model, price, fuel_efficiency, electric_range):
-        super().__init__(make, model, price)
+    __slots__ = ("fuel_efficiency", "electric_range")
+
+    def __init__(self, make, model, price, fuel_efficiency, electric_range, car_id=None):
+        super().__init__(make, model, price, car_id)
         if fuel_efficiency <= 0 or electric_range <= 0:
             raise ValueError("Fuel efficiency and electric range must be positive numbers.")
         self.fuel_efficiency = fuel_efficiency
         self.electric_range = electric_range
 
+# --------------------- Search Indexes ---------------------
+# Range operators accepted by Inventory.search as "<attribute>__<operator>".
+RANGE_OPERATORS = ("lt", "le", "gt", "ge", "between")
+
+class HashIndex:
+    # Maps each value of one attribute to the cars that have it. Cars without the
+    # attribute are not indexed.
+    def __init__(self, key):
+        self.key = key
+        self.cars = defaultdict(set)
+
+    def add(self, car: Car):
+        value = self.key(car)
+        if value is not None:
+            self.cars[value].add(car)
+
+    def remove(self, car: Car):
+        value = self.key(car)
+        if value is not None:
+            cars = self.cars[value]
+            cars.discard(car)
+            if not cars:
+                del self.cars[value]
+
+    def lookup(self, value):
+        return self.cars.get(value, set())
+
+class SortedIndex:
+    # Keeps (value, position, car) entries sorted by value, so equality and range lookups
+    # are two binary searches plus the size of the result. position is the car's
+    # insertion number in the inventory, which makes every entry unique and keeps cars
+    # from ever being compared. New entries are appended to a pending list and sorted in
+    # before the next lookup (one sort for a whole bulk load), and removed entries are
+    # only marked and dropped in one pass once they make up half of the index, so
+    # neither adding nor removing shifts the list.
+    def __init__(self, attribute):
+        self.attribute = attribute
+        self.entries = []
+        self.pending = []
+        self.removed = set()  # (value, position) of entries still in the lists
+
+    def add(self, car: Car, position: int):
+        value = getattr(car, self.attribute, None)
+        if value is not None:
+            if (value, position) in self.removed:
+                self.removed.discard((value, position))
+            else:
+                self.pending.append((value, position, car))
+
+    def remove(self, car: Car, position: int):
+        value = getattr(car, self.attribute, None)
+        if value is not None:
+            self.removed.add((value, position))
+            if 2 * len(self.removed) > len(self.entries) + len(self.pending):
+                removed = self.removed
+                self.entries = [entry for entry in self.entries if entry[:2] not in removed]
+                self.pending = [entry for entry in self.pending if entry[:2] not in removed]
+                removed.clear()
+
+    def _range(self, operator, value):
+        # Returns the (start, stop) slice of entries that match.
+        if self.pending:
+            # The entries are one sorted run followed by the pending ones, which sort()
+            # merges in O(n + k log k).
+            self.entries += self.pending
+            self.entries.sort()
+            self.pending = []
+        entries = self.entries
+        # (x,) sorts before every entry with value x and (x, inf) after all of them.
+        before = lambda x: bisect_left(entries, (x,))
+        after = lambda x: bisect_right(entries, (x, math.inf))
+        if operator == "eq":
+            return before(value), after(value)
+        if operator == "between":
+            return before(value[0]), after(value[1])
+        if operator == "lt":
+            return 0, before(value)
+        if operator == "le":
+            return 0, after(value)
+        if operator == "gt":
+            return after(value), len(entries)
+        return before(value), len(entries)
+
+    def count(self, operator, value) -> int:
+        # The number of matching entries, counting removed ones not yet dropped.
+        start, stop = self._range(operator, value)
+        return stop - start
+
+    def lookup(self, operator, value):
+        start, stop = self._range(operator, value)
+        removed = self.removed
+        return (car for value, position, car in self.entries[start:stop] if (value, position) not in removed)
+
+# Comparisons of an attribute value with the filter value, by search operator.
+_COMPARISONS = {
+    "lt": lambda actual, value: actual < value,
+    "le": lambda actual, value: actual <= value,
+    "gt": lambda actual, value: actual > value,
+    "ge": lambda actual, value: actual >= value,
+    "between": lambda actual, value: value[0] <= actual <= value[1],
+}
+
+def _predicate(key: str, operator: str, value):
+    # Builds the test for one search filter once, so checking a car is a single call.
+    if key == "type" and operator == "eq":
+        return lambda car: issubclass(car.car_type, value)
+    if operator == "eq":
+        return lambda car: getattr(car, key, None) == value
+    compare = _COMPARISONS[operator]
+
+    def test(car):
+        actual = getattr(car, key, None)
+        return actual is not None and compare(actual, value)
+    return test
+
 # --------------------- Inventory Management ---------------------
+class CarsView:
+    # The live, read-only view returned by Inventory.cars: it iterates in inventory
+    # order, and len() and "car in inventory.cars" take constant time. Changes go
+    # through add_car and remove_car, so list methods fail loudly instead of changing
+    # a copy.
+    __slots__ = ("_inventory",)
+
+    def __init__(self, inventory: "Inventory"):
+        self._inventory = inventory
+
+    def __len__(self):
+        return len(self._inventory)
+
+    def __iter__(self):
+        return iter(self._inventory)
+
+    def __contains__(self, car):
+        return car in self._inventory
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        return self._inventory._car_at(index)
+
+    def __eq__(self, other):
+        return list(self) == list(other) if isinstance(other, (list, tuple, CarsView)) else NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def _read_only(self, *args):
+        raise TypeError("Inventory.cars is read-only; use add_car() and remove_car().")
+
+    append = extend = insert = remove = pop = clear = _read_only
+
 class Inventory:
+    HASH_INDEXES = ("make", "model")
+    SORTED_INDEXES = ("price", "battery_capacity", "fuel_efficiency")
+
     def __init__(self):
-        self.cars = []
-    
+        self._cars = {}  # car_id -> car, in insertion order
+        self._positions = {}  # car -> insertion number, the inventory order
+        self._next_position = 0
+        self._hash_indexes = {attribute: HashIndex(lambda car, attribute=attribute: getattr(car, attribute, None))
+                              for attribute in self.HASH_INDEXES}
+        self._hash_indexes["type"] = HashIndex(lambda car: car.car_type)
+        self._sorted_indexes = {attribute: SortedIndex(attribute) for attribute in self.SORTED_INDEXES}
+
+    def _index(self, car: Car, position: int):
+        self._positions[car] = position
+        for index in self._hash_indexes.values():
+            index.add(car)
+        for index in self._sorted_indexes.values():
+            index.add(car, position)
+
+    def _unindex(self, car: Car) -> int:
+        position = self._positions.pop(car)
+        for index in self._hash_indexes.values():
+            index.remove(car)
+        for index in self._sorted_indexes.values():
+            index.remove(car, position)
+        return position
+
+    @property
+    def cars(self) -> CarsView:
+        return CarsView(self)
+
+    def __len__(self):
+        return len(self._cars)
+
+    def __iter__(self):
+        return iter(self._cars.values())
+
+    def _car_at(self, index: int) -> Car:
+        # The car behind inventory.cars[index]. The cars live in a dict, so this skips
+        # index cars with islice instead of copying them all into a list; loops should
+        # still iterate over inventory.cars rather than index it.
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Inventory index out of range.")
+        return next(islice(self._cars.values(), index, None))
+
+    def __contains__(self, car: Car):
+        # Equality is identity for cars, while FleetRow proxies of the same row are equal.
+        stored = self._cars.get(getattr(car, "car_id", None))
+        return stored is not None and stored == car
+
+    def get_car(self, car_id: str):
+        return self._cars.get(car_id)
+
     def add_car(self, car: Car):
         if not isinstance(car, Car):
             raise TypeError("Only Car objects can be added to inventory.")
-        if car in self.cars:
+        if car in self:
             print(f"{car} is already in inventory.")
+        elif car.car_id in self._cars:
+            raise ValueError(f"Another car with ID {car.car_id} is already in inventory.")
         else:
-            self.cars.append(car)
+            self._cars[car.car_id] = car
+            self._index(car, self._next_position)
+            self._next_position += 1
             print(f"{car} added to inventory.")
 
     def remove_car(self, car: Car):
-        if car in self.cars:
-            self.cars.remove(car)
+        if car in self:
+            del self._cars[car.car_id]
+            self._unindex(car)
             print(f"{car} removed from inventory.")
         else:
             print("Car not found in inventory.")
+
+    def update_car(self, car: Car, **attributes):
+        # Changes attributes of a car in the inventory and keeps the indexes in step.
+        # Assigning indexed attributes directly would leave the indexes stale.
+        if "car_id" in attributes:
+            raise ValueError("The car ID cannot be changed.")
+        position = self._unindex(car) if car in self._positions else None
+        for key, value in attributes.items():
+            setattr(car, key, value)
+        if position is not None:
+            self._index(car, position)
     
     def search(self, **filters):
-        results = self.cars
-        for key, value in filters.items():
-            results = [car for car in results if getattr(car, key, None) == value]
+        # Filters are "<attribute>=value" for equality, "<attribute>__<operator>=value"
+        # with an operator from RANGE_OPERATORS (between takes a (low, high) pair, both
+        # inclusive), and "type=SomeCarClass", which matches instances of that class and
+        # its subclasses. The indexed filter with the fewest matches supplies the
+        # candidates and every other filter is checked on those cars only. When even that
+        # filter matches more than an eighth of the inventory, one scan in inventory order
+        # is cheaper than collecting and sorting candidates, so the scan is used instead.
+        # Results keep the inventory order.
+        predicates = []
+        best, best_size = None, len(self._cars) // 8
+        for name, value in filters.items():
+            key, _, operator = name.partition("__")
+            operator = operator or "eq"
+            if operator != "eq" and operator not in RANGE_OPERATORS:
+                raise ValueError(f"Unknown search operator {operator!r}.")
+            predicate = candidates = None
+            if key == "type" and operator == "eq":
+                cars = self._hash_indexes["type"].cars
+                sets = [cars[cls] for cls in cars if issubclass(cls, value)]
+                size, candidates = sum(map(len, sets)), partial(chain.from_iterable, sets)
+                if len(sets) == 1:
+                    predicate = sets[0].__contains__
+            elif key in self._hash_indexes and operator == "eq" and value is not None:
+                matching = self._hash_indexes[key].lookup(value)
+                # Set membership runs in C, which beats reading the attribute of every car.
+                size, candidates, predicate = len(matching), partial(iter, matching), matching.__contains__
+            elif key in self._sorted_indexes and value is not None:
+                index = self._sorted_indexes[key]
+                size, candidates = index.count(operator, value), partial(index.lookup, operator, value)
+            predicates.append(predicate or _predicate(key, operator, value))
+            if candidates is not None and size < best_size:
+                best, best_size = (len(predicates) - 1, candidates), size
+        if best is None:
+            results = self._cars.values()
+        else:
+            chosen, candidates = best
+            results = candidates()
+            del predicates[chosen]
+        for predicate in predicates:
+            results = filter(predicate, results)
+        results = list(results)
+        if best is not None:
+            results.sort(key=self._positions.__getitem__)
         return results
 
     def display_inventory(self):
-        if not self.cars:
+        if not len(self):
             print("Inventory is empty.")
         else:
-            for car in self.cars:
+            for car in self:
                 print(car)
 
 # --------------------- Person Interface ---------------------
@@ -82,7 +368,7 @@ class Customer(Person):
         self.purchased_cars = []
     
     def buy_car(self, inventory: Inventory, car: Car, salesperson):
-        if car in inventory.cars:
+        if car in inventory:
             salesperson.initiate_sale(self, car)
             self.purchased_cars.append(car)
             inventory.remove_car(car)
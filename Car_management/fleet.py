@@ -0,0 +1,210 @@
+import math
+import sys
+from array import array
+from typing import Iterable
+
+from car import Car, ElectricCar, HybridCar, new_car_id
+
+# --------------------- Columnar Fleet Storage ---------------------
+# Car classes a FleetTable can hold, in the order of their kind codes.
+KINDS = (Car, ElectricCar, HybridCar)
+
+# Spec columns: every attribute that one of the car classes adds to Car.
+SPECS = tuple(spec for kind in KINDS[1:] for spec in kind.__slots__)
+
+MISSING = math.nan
+
+def _number(value: float):
+    # Whole numbers come back as int, so prices print as they were entered.
+    return int(value) if value.is_integer() else value
+
+def _encoded(name: str):
+    # A dictionary-encoded text column: the table stores a small integer code per row.
+    def get(row):
+        table = row._table
+        return getattr(table, f"_{name}_values")[getattr(table, f"_{name}_codes")[row._row]]
+
+    def put(row, value):
+        if not isinstance(value, str):
+            raise TypeError("Make and model must be strings.")
+        table = row._table
+        getattr(table, f"_{name}_codes")[row._row] = table._encode(name, value)
+    return property(get, put)
+
+def _numeric(name: str):
+    def get(row):
+        value = getattr(row._table, f"_{name}")[row._row]
+        if math.isnan(value):
+            raise AttributeError(f"{row.car_type.__name__} has no attribute {name!r}")
+        return _number(value)
+
+    def put(row, value):
+        if not isinstance(value, (int, float)) or value <= 0:
+            raise ValueError(f"{name} must be a positive number.")
+        if name != "price" and name not in row.car_type.__slots__:
+            raise AttributeError(f"{row.car_type.__name__} has no attribute {name!r}")
+        getattr(row._table, f"_{name}")[row._row] = value
+    return property(get, put)
+
+class FleetRow(Car):
+    # A lightweight view of one row of a FleetTable that behaves like a Car: it has the
+    # same attributes (plus the spec attributes of its car type), prints the same way
+    # and can be added to an Inventory. Reading and assigning attributes goes straight
+    # to the table's columns; nothing is copied. Assignments bypass the search indexes of
+    # an Inventory holding the row, so change such rows with inventory.update_car().
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: "FleetTable", row: int):
+        self._table = table
+        self._row = row
+
+    @property
+    def car_id(self):
+        return self._table._car_ids[self._row]
+
+    make = _encoded("make")
+    model = _encoded("model")
+    price = _numeric("price")
+    battery_capacity = _numeric("battery_capacity")
+    charging_time = _numeric("charging_time")
+    fuel_efficiency = _numeric("fuel_efficiency")
+    electric_range = _numeric("electric_range")
+
+    @property
+    def car_type(self):
+        return KINDS[self._table._kinds[self._row]]
+
+    def to_car(self) -> Car:
+        # Builds a regular Car, ElectricCar or HybridCar object with the same data.
+        kind = self.car_type
+        specs = [getattr(self, spec) for spec in kind.__slots__ if spec in SPECS]
+        return kind(self.make, self.model, self.price, *specs, car_id=self.car_id)
+
+    def __eq__(self, other):
+        # Proxies handed out for the same row are the same car, so they are equal and
+        # hash alike, e.g. for "table[1] in inventory".
+        if not isinstance(other, FleetRow):
+            return NotImplemented
+        return self._table is other._table and self._row == other._row
+
+    def __hash__(self):
+        return hash((id(self._table), self._row))
+
+    def __repr__(self):
+        return f"FleetRow({self._row}, {self.car_type.__name__}, {self})"
+
+class FleetTable:
+    # Stores a fleet column by column instead of as one object per car. make and model
+    # are dictionary-encoded (each distinct string is stored once and rows keep a 4-byte
+    # code), prices and specs are 8-byte doubles in typed arrays, with NaN for specs a
+    # car type does not have. table[i] and iteration hand out FleetRow views, and the
+    # aggregations run over the arrays without creating any objects.
+    def __init__(self, cars: Iterable[Car] = ()):
+        self._car_ids = []
+        self._kinds = array("B")
+        self._make_values, self._make_lookup, self._make_codes = [], {}, array("I")
+        self._model_values, self._model_lookup, self._model_codes = [], {}, array("I")
+        self._price = array("d")
+        for spec in SPECS:
+            setattr(self, f"_{spec}", array("d"))
+        self.extend(cars)
+
+    def _encode(self, name: str, value: str) -> int:
+        lookup = getattr(self, f"_{name}_lookup")
+        code = lookup.get(value)
+        if code is None:
+            values = getattr(self, f"_{name}_values")
+            code = lookup[value] = len(values)
+            values.append(sys.intern(value))
+        return code
+
+    def append(self, make: str, model: str, price: float, car_type=Car, car_id: str = None, **specs) -> FleetRow:
+        # Adds one car without creating a Car object. specs are the attributes of
+        # car_type, e.g. battery_capacity and charging_time for ElectricCar.
+        if car_type not in KINDS:
+            raise TypeError(f"Unsupported car type {car_type!r}.")
+        if not isinstance(make, str) or not isinstance(model, str):
+            raise TypeError("Make and model must be strings.")
+        if not isinstance(price, (int, float)) or price <= 0:
+            raise ValueError("Price must be a positive number.")
+        expected = set(car_type.__slots__) & set(SPECS)
+        if set(specs) != expected:
+            raise TypeError(f"{car_type.__name__} needs exactly these specs: {', '.join(sorted(expected)) or 'none'}.")
+        if any(value <= 0 for value in specs.values()):
+            raise ValueError("Specs must be positive numbers.")
+        if car_id is None:
+            car_id = new_car_id()
+        elif not isinstance(car_id, str):
+            raise TypeError("Car ID must be a string.")
+
+        self._car_ids.append(car_id)
+        self._kinds.append(KINDS.index(car_type))
+        self._make_codes.append(self._encode("make", make))
+        self._model_codes.append(self._encode("model", model))
+        self._price.append(price)
+        for spec in SPECS:
+            getattr(self, f"_{spec}").append(specs.get(spec, MISSING))
+        return FleetRow(self, len(self._car_ids) - 1)
+
+    def add_car(self, car: Car) -> FleetRow:
+        car_type = car.car_type
+        specs = {spec: getattr(car, spec) for spec in SPECS if spec in car_type.__slots__}
+        return self.append(car.make, car.model, car.price, car_type, car.car_id, **specs)
+
+    def extend(self, cars: Iterable[Car]):
+        for car in cars:
+            self.add_car(car)
+
+    def __len__(self):
+        return len(self._car_ids)
+
+    def __getitem__(self, row: int) -> FleetRow:
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("FleetTable index out of range.")
+        return FleetRow(self, row)
+
+    def __iter__(self):
+        return (FleetRow(self, row) for row in range(len(self)))
+
+    def column(self, name: str):
+        # The raw column of a numeric attribute (an array of doubles, NaN where missing).
+        if name != "price" and name not in SPECS:
+            raise KeyError(name)
+        return getattr(self, f"_{name}")
+
+    def _groups(self, by: str):
+        # Returns (group names, per-row group codes) for "make", "model" or "type".
+        if by == "type":
+            return [kind.__name__ for kind in KINDS], self._kinds
+        if by in ("make", "model"):
+            return getattr(self, f"_{by}_values"), getattr(self, f"_{by}_codes")
+        raise KeyError(by)
+
+    def count_by(self, by: str) -> dict:
+        names, codes = self._groups(by)
+        counts = [0] * len(names)
+        for code in codes:
+            counts[code] += 1
+        return {name: total for name, total in zip(names, counts) if total}
+
+    def _totals(self, by: str, column: str):
+        # Per-group (name, sum, count) of the non-missing values of column.
+        names, codes = self._groups(by)
+        sums = [0.0] * len(names)
+        counts = [0] * len(names)
+        for code, value in zip(codes, self.column(column)):
+            if value == value:  # skips NaN
+                sums[code] += value
+                counts[code] += 1
+        return [(name, total, seen) for name, total, seen in zip(names, sums, counts) if seen]
+
+    def sum_by(self, by: str, column: str = "price") -> dict:
+        return {name: total for name, total, _ in self._totals(by, column)}
+
+    def mean_by(self, by: str, column: str = "price") -> dict:
+        return {name: total / seen for name, total, seen in self._totals(by, column)}
+
+    def average_price_by_make(self) -> dict:
+        return self.mean_by("make", "price")
@@ -0,0 +1,290 @@
+import csv
+import sqlite3
+from typing import List
+
+from car import Car, Customer, ElectricCar, HybridCar, Inventory, RANGE_OPERATORS, Salesperson
+
+# --------------------- SQLite Persistence ---------------------
+CAR_TYPES = {cls.__name__: cls for cls in (Car, ElectricCar, HybridCar)}
+
+# Spec columns in the order the car constructors take them.
+SPECS = ("battery_capacity", "charging_time", "fuel_efficiency", "electric_range")
+
+# Columns that Inventory.search filters can refer to.
+SEARCHABLE = ("car_id", "make", "model", "price") + SPECS
+
+# NUMERIC columns keep whole numbers as integers, so prices read back as they were saved.
+# cars_position lets the MAX(position) in every insert read one index entry instead of
+# scanning cars_stock_position.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cars (
+    car_id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    make TEXT NOT NULL,
+    model TEXT NOT NULL,
+    price NUMERIC NOT NULL,
+    battery_capacity NUMERIC,
+    charging_time NUMERIC,
+    fuel_efficiency NUMERIC,
+    electric_range NUMERIC,
+    in_stock INTEGER NOT NULL DEFAULT 1,
+    position INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cars_stock_position ON cars (in_stock, position);
+CREATE INDEX IF NOT EXISTS cars_position ON cars (position);
+CREATE INDEX IF NOT EXISTS cars_make ON cars (make);
+CREATE INDEX IF NOT EXISTS cars_model ON cars (model);
+CREATE INDEX IF NOT EXISTS cars_type ON cars (type);
+CREATE INDEX IF NOT EXISTS cars_price ON cars (price);
+CREATE INDEX IF NOT EXISTS cars_battery_capacity ON cars (battery_capacity);
+CREATE INDEX IF NOT EXISTS cars_fuel_efficiency ON cars (fuel_efficiency);
+CREATE TABLE IF NOT EXISTS sales (
+    sale_id INTEGER PRIMARY KEY,
+    salesperson TEXT NOT NULL,
+    customer_name TEXT NOT NULL,
+    customer_contact TEXT NOT NULL,
+    car_id TEXT NOT NULL REFERENCES cars (car_id),
+    price NUMERIC NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sales_salesperson ON sales (salesperson, sale_id);
+"""
+
+CAR_COLUMNS = "car_id, type, make, model, price, battery_capacity, charging_time, fuel_efficiency, electric_range"
+
+INSERT_CAR = f"""
+INSERT INTO cars ({CAR_COLUMNS}, in_stock, position)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, (SELECT COALESCE(MAX(position), 0) + 1 FROM cars))
+ON CONFLICT (car_id) DO UPDATE SET
+    type = excluded.type, make = excluded.make, model = excluded.model, price = excluded.price,
+    battery_capacity = excluded.battery_capacity, charging_time = excluded.charging_time,
+    fuel_efficiency = excluded.fuel_efficiency, electric_range = excluded.electric_range,
+    in_stock = MAX(in_stock, excluded.in_stock),
+    position = CASE WHEN excluded.in_stock AND NOT in_stock THEN excluded.position ELSE position END
+WHERE type = excluded.type AND make = excluded.make AND model = excluded.model
+"""
+
+UPDATE_CAR = """
+UPDATE cars SET type = ?, make = ?, model = ?, price = ?,
+    battery_capacity = ?, charging_time = ?, fuel_efficiency = ?, electric_range = ?
+WHERE car_id = ?
+"""
+
+def _car_row(car: Car, in_stock: int = 1) -> tuple:
+    return (car.car_id, car.car_type.__name__, car.make, car.model, car.price,
+            *(getattr(car, spec, None) for spec in SPECS), in_stock)
+
+def _car_from_row(row) -> Car:
+    car_id, car_type, make, model, price, *specs = row
+    return CAR_TYPES[car_type](make, model, price, *(spec for spec in specs if spec is not None), car_id=car_id)
+
+def _number(text: str):
+    return int(text) if text.strip().lstrip("-").isdigit() else float(text)
+
+class CarDatabase:
+    # A connection to the SQLite file that stores cars and sales. The database runs in
+    # write-ahead-log mode, so readers in other connections do not block a writer. Use
+    # one CarDatabase per thread or process.
+    def __init__(self, path: str = "dealership.db"):
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def save_car(self, car: Car, in_stock: int = 1):
+        # Inserts a car, or updates the stored row of the same car: one with the same
+        # car_id, type, make and model. A car that is put back in stock moves to the end
+        # of the inventory order; a sold car that is saved again keeps its stock state.
+        # Raises ValueError when the car_id belongs to a different stored car.
+        with self.connection:
+            self._save_car(car, in_stock)
+
+    def _save_car(self, car: Car, in_stock: int):
+        # The upsert changes no row when the stored car is a different one.
+        if not self.connection.execute(INSERT_CAR, _car_row(car, in_stock)).rowcount:
+            raise ValueError(f"Car ID {car.car_id} already belongs to another stored car.")
+
+    def update_car(self, car: Car):
+        # Writes the current attributes of a stored car, whatever they were before.
+        row = _car_row(car)
+        with self.connection:
+            self.connection.execute(UPDATE_CAR, row[1:-1] + row[:1])
+
+    def import_csv(self, path: str) -> int:
+        # Loads cars in stock from a CSV file with a header row of type, make, model,
+        # price, the spec columns of the types used and optionally car_id. Every row is
+        # validated through the car constructors, then all rows are written with one
+        # executemany in one transaction: a bad row or a duplicate car_id raises
+        # ValueError and nothing is imported. Returns the number of cars imported.
+        def rows():
+            with open(path, newline="", encoding="utf-8") as file:
+                reader = csv.DictReader(file)
+                for record in reader:
+                    try:
+                        cls = CAR_TYPES[record["type"]]
+                        specs = [_number(record[spec]) for spec in cls.__slots__ if spec in SPECS]
+                        car = cls(record["make"], record["model"], _number(record["price"]), *specs,
+                                  car_id=record.get("car_id") or None)
+                    except (KeyError, TypeError, ValueError) as error:
+                        raise ValueError(f"{path}, line {reader.line_num}: {error!r}") from None
+                    yield _car_row(car) + (position + reader.line_num,)
+
+        position = self.connection.execute("SELECT COALESCE(MAX(position), 0) FROM cars").fetchone()[0]
+        before = self.connection.total_changes
+        try:
+            with self.connection:
+                self.connection.executemany(
+                    f"INSERT INTO cars ({CAR_COLUMNS}, in_stock, position) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows())
+        except sqlite3.IntegrityError as error:
+            raise ValueError(f"{path}: {error} (duplicate car_id?)") from None
+        return self.connection.total_changes - before
+
+# --------------------- Persistent Inventory ---------------------
+class PersistentInventory(Inventory):
+    # An Inventory whose cars live in a CarDatabase instead of memory. Opening it does not
+    # load anything: membership, lookups and search() are SQL queries on indexed columns,
+    # and cars are built from rows when they are read. Cars compare by car_id here, so
+    # "car in inventory" is true for any object with the ID of a car in stock. Removed
+    # and sold cars stay in the database for the sales history; adding one of them
+    # again puts it back in stock, while adding a different car with its ID raises
+    # ValueError.
+    def __init__(self, database: CarDatabase):
+        super().__init__()
+        self.database = database
+        self.connection = database.connection
+
+    def _select(self, where: str = "1", parameters=()) -> List[Car]:
+        rows = self.connection.execute(
+            f"SELECT {CAR_COLUMNS} FROM cars WHERE in_stock AND ({where}) ORDER BY position", parameters)
+        return [_car_from_row(row) for row in rows]
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM cars WHERE in_stock").fetchone()[0]
+
+    def __iter__(self):
+        return iter(self._select())
+
+    def _car_at(self, index: int) -> Car:
+        if index < 0:
+            index += len(self)
+        row = None if index < 0 else self.connection.execute(
+            f"SELECT {CAR_COLUMNS} FROM cars WHERE in_stock ORDER BY position LIMIT 1 OFFSET ?", (index,)).fetchone()
+        if row is None:
+            raise IndexError("Inventory index out of range.")
+        return _car_from_row(row)
+
+    def __contains__(self, car: Car):
+        car_id = getattr(car, "car_id", None)
+        return self.connection.execute(
+            "SELECT 1 FROM cars WHERE car_id = ? AND in_stock", (car_id,)).fetchone() is not None
+
+    def get_car(self, car_id: str):
+        cars = self._select("car_id = ?", (car_id,))
+        return cars[0] if cars else None
+
+    def add_car(self, car: Car):
+        if not isinstance(car, Car):
+            raise TypeError("Only Car objects can be added to inventory.")
+        if car in self:
+            print(f"{car} is already in inventory.")
+        else:
+            self.database.save_car(car)
+            print(f"{car} added to inventory.")
+
+    def remove_car(self, car: Car):
+        with self.connection:
+            removed = self.connection.execute(
+                "UPDATE cars SET in_stock = 0 WHERE car_id = ? AND in_stock", (getattr(car, "car_id", None),)).rowcount
+        if removed:
+            print(f"{car} removed from inventory.")
+        else:
+            print("Car not found in inventory.")
+
+    def update_car(self, car: Car, **attributes):
+        if "car_id" in attributes:
+            raise ValueError("The car ID cannot be changed.")
+        for key, value in attributes.items():
+            setattr(car, key, value)
+        if car in self:
+            self.database.update_car(car)
+
+    def import_csv(self, path: str) -> int:
+        return self.database.import_csv(path)
+
+    def search(self, **filters):
+        # The same filters as Inventory.search, translated to one parameterized query.
+        conditions, parameters = [], []
+        for name, value in filters.items():
+            key, _, operator = name.partition("__")
+            operator = operator or "eq"
+            if key == "type" and operator == "eq":
+                names = [type_name for type_name, cls in CAR_TYPES.items() if issubclass(cls, value)]
+                conditions.append(f"type IN ({', '.join('?' * len(names))})")
+                parameters.extend(names)
+            elif key not in SEARCHABLE:
+                raise ValueError(f"Cannot search cars by {key!r}.")
+            elif operator == "eq":
+                if value is None:
+                    conditions.append(f"{key} IS NULL")
+                else:
+                    conditions.append(f"{key} = ?")
+                    parameters.append(value)
+            elif operator == "between":
+                conditions.append(f"{key} BETWEEN ? AND ?")
+                parameters.extend(value)
+            elif operator in RANGE_OPERATORS:
+                conditions.append(f"{key} {dict(lt='<', le='<=', gt='>', ge='>=')[operator]} ?")
+                parameters.append(value)
+            else:
+                raise ValueError(f"Unknown search operator {operator!r}.")
+        return self._select(" AND ".join(conditions) or "1", parameters)
+
+# --------------------- Persistent Sales History ---------------------
+class SalesLog:
+    # The sales of one salesperson, stored in the database. It supports what Salesperson
+    # does with its sales_history list: append((customer, car)), iteration, len() and
+    # truth testing. Customers and cars are rebuilt from the stored rows, with the price
+    # recorded at the time of the sale.
+    def __init__(self, database: CarDatabase, salesperson: str):
+        self.database = database
+        self.salesperson = salesperson
+
+    def append(self, sale):
+        customer, car = sale
+        connection = self.database.connection
+        with connection:
+            # Makes sure the car is stored, e.g. when it was sold from an in-memory inventory.
+            # Raises ValueError, recording nothing, if its ID belongs to another car.
+            self.database._save_car(car, 0)
+            connection.execute("INSERT INTO sales (salesperson, customer_name, customer_contact, car_id, price) "
+                               "VALUES (?, ?, ?, ?, ?)",
+                               (self.salesperson, customer.name, customer.contact_info, car.car_id, car.price))
+
+    def __iter__(self):
+        # The price is the one the car was sold at, even if it was restocked at another.
+        columns = ", ".join("sales.price" if column.strip() == "price" else f"cars.{column.strip()}"
+                            for column in CAR_COLUMNS.split(","))
+        rows = self.database.connection.execute(
+            f"SELECT sales.customer_name, sales.customer_contact, {columns} FROM sales "
+            "JOIN cars ON cars.car_id = sales.car_id WHERE sales.salesperson = ? ORDER BY sales.sale_id",
+            (self.salesperson,))
+        return iter([(Customer(name, contact), _car_from_row(car)) for name, contact, *car in rows])
+
+    def __len__(self):
+        return self.database.connection.execute(
+            "SELECT COUNT(*) FROM sales WHERE salesperson = ?", (self.salesperson,)).fetchone()[0]
+
+class PersistentSalesperson(Salesperson):
+    # A Salesperson whose sales history is kept in the database under their name.
+    def __init__(self, name, contact_info, commission_rate: float, database: CarDatabase):
+        super().__init__(name, contact_info, commission_rate)
+        self.sales_history = SalesLog(database, name)
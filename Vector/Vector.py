@@ -1,5 +1,28 @@
+import mmap
+import os
+import struct
 import sys
-from typing import Iterable, Union, Any
+from array import array
+from itertools import islice
+from operator import add, mul, sub
+from typing import Callable, Iterable, Iterator, Union, Any, Optional
+
+import vector_backend
+
+# Typecodes accepted for contiguous storage: C doubles and signed 64-bit integers.
+TYPECODES = ('d', 'q')
+
+# Value stored in the unused slots between size and capacity.
+_FILLER = 0
+
+# Elements read at a time from operands that do not know their length (generators,
+# file or socket readers).
+STREAM_CHUNK = 4096
+
+# Binary file layout: magic, typecode, 3 padding bytes, element count, then the elements,
+# all little-endian. The 16-byte header keeps the data 8-byte aligned for mmap.
+_FILE_MAGIC = b'PVEC'
+_FILE_HEADER = struct.Struct('<4sc3xQ')
 
 class VectorOverflowError(Exception):
     """Raised when more elements are added than the vector's maximum allowed size."""
@@ -9,22 +32,135 @@ class DimensionalError(Exception):
     """Raised when two vectors have different dimensions."""
     pass
 
+def _infer_typecode(values: Iterable) -> str:
+    """Returns 'q' when every value is an integer and 'd' otherwise."""
+    return 'q' if all(isinstance(v, int) for v in values) else 'd'
+
+def _storage_root(storage: Any) -> Any:
+    """
+    Returns the object that owns the elements of vector storage: the array, mmap or list
+    behind a memoryview or strided list window, or the storage itself.
+    """
+    if isinstance(storage, memoryview):
+        return storage.obj
+    if isinstance(storage, _StridedList):
+        return storage._list
+    return storage
+
 class Vector:
     """
     An n-dimensional vector class that supports element-wise operations, operator overloading,
     and standard vector-like functionalities.
     """
     
-    def __init__(self, *args: Union[int, float]) -> None:
+    # Operand types whose reflected operators handle mixed arithmetic (see sparse_vector).
+    _deferred_types: tuple = ()
+    
+    def __init__(self, *args: Union[int, float], typecode: Optional[str] = None) -> None:
         """
         Constructs a vector with the provided elements.
         
         :param args: The initial elements of the vector.
+        :param typecode: None keeps the elements in a Python list. 'd' or 'q' stores them
+                         contiguously in an array.array of doubles or 64-bit integers, and
+                         'auto' picks one of the two from the element types.
         """
+        if typecode == 'auto':
+            typecode = _infer_typecode(args)
+        if typecode is not None and typecode not in TYPECODES:
+            raise ValueError(f"Unsupported typecode {typecode!r}; expected one of {TYPECODES} or 'auto'.")
         self._max_size: int = sys.maxsize
         self._size: int = len(args)
-        self._capacity: int = self._size * 2 + 1
-        self._data: list[Union[int, float]] = list(args)
+        self._capacity: int = self._size
+        self._typecode: Optional[str] = typecode
+        self._data: Union[list[Union[int, float]], array] = list(args) if typecode is None else array(typecode, args)
+        self._epoch: list[int] = [0]
+        self._cache: Optional[tuple[int, dict]] = None
+    
+    @classmethod
+    def _from_storage(cls, data: Union[list, array], typecode: Optional[str] = None) -> 'Vector':
+        """
+        Builds a vector around already prepared storage without copying it.
+        
+        :param data: A list, or an array.array whose typecode matches typecode.
+        :param typecode: The typecode of data, or None for a list.
+        """
+        vector = cls.__new__(cls)
+        vector._max_size = sys.maxsize
+        vector._size = len(data)
+        vector._capacity = vector._size
+        vector._typecode = typecode
+        vector._data = data
+        vector._epoch = [0]
+        vector._cache = None
+        return vector
+    
+    @classmethod
+    def from_iter(cls, iterable: Iterable, chunk: int = STREAM_CHUNK, typecode: Optional[str] = None) -> 'Vector':
+        """
+        Builds a vector from any iterable, reading it chunk elements at a time instead of
+        unpacking everything into *args first.
+        
+        :param iterable: The elements, possibly a generator.
+        :param chunk: The number of elements read per step.
+        :param typecode: As in the constructor. 'auto' starts with 'q' storage and widens it
+                         to 'd' when the first float arrives.
+        """
+        if chunk <= 0:
+            raise ValueError('Chunk size must be positive.')
+        auto = typecode == 'auto'
+        vector = cls(typecode='q' if auto else typecode)
+        iterator = iter(iterable)
+        while True:
+            block = list(islice(iterator, chunk))
+            if not block:
+                return vector
+            if auto and vector._typecode == 'q' and _infer_typecode(block) == 'd':
+                vector._data = array('d', vector._data)
+                vector._typecode = 'd'
+            vector.extend(block)
+    
+    def _new(self, values: list) -> 'Vector':
+        """
+        Wraps the result of an element-wise operation in a vector with the same kind of
+        storage as this one. Integer storage is widened to doubles when needed.
+        
+        :param values: The computed elements (a list or a backend result).
+        """
+        values = vector_backend.active.materialize(values, self._typecode is not None)
+        if self._typecode is None:
+            return Vector._from_storage(values)
+        if isinstance(values, array):
+            return Vector._from_storage(values, values.typecode)
+        typecode = self._typecode
+        if typecode == 'q' and not all(isinstance(v, int) for v in values):
+            typecode = 'd'
+        return Vector._from_storage(array(typecode, values), typecode)
+        
+    @property
+    def typecode(self) -> Optional[str]:
+        """Returns the array typecode of the storage, or None for list storage."""
+        return self._typecode
+    
+    def data(self) -> memoryview:
+        """
+        Returns a zero-copy memoryview over the elements of a typed vector.
+        
+        The view can be handed to file and socket I/O directly. While it is alive the
+        vector cannot reallocate its storage (array.array raises BufferError). Writes
+        through the view bypass the cached norms and sums; call invalidate() after them.
+        """
+        if self._typecode is None:
+            raise TypeError('List-backed vectors do not expose a buffer; construct with a typecode.')
+        return memoryview(self._data)[:self._size]
+    
+    def __buffer__(self, flags: int) -> memoryview:
+        """Exports the typed storage through the buffer protocol (memoryview(vector))."""
+        return self.data()
+    
+    def __release_buffer__(self, view: memoryview) -> None:
+        """Releases a buffer obtained through __buffer__."""
+        view.release()
         
     @property
     def size(self) -> int:
@@ -35,21 +171,80 @@ class Vector:
     def size(self, new_size: int) -> None:
         if new_size > self._max_size:
             raise VectorOverflowError(f"Cannot add more elements: max size {self._max_size} exceeded.")
+        if new_size > self._capacity:
+            self._adjust_capacity(new_size)
+        elif new_size < self._size:
+            self._release(new_size, self._size)
+        self.invalidate()
         self._size = new_size
 
     @property
     def capacity(self) -> int:
-        """Returns the current capacity of the vector."""
+        """Returns the number of elements the storage can hold without reallocating."""
         return self._capacity
     
+    def _elements(self) -> Union[list, array]:
+        """Returns the live elements, without the unused slots past size."""
+        data = self._data
+        return data if len(data) == self._size else data[:self._size]
+    
+    def _release(self, start: int, stop: int) -> None:
+        """
+        Overwrites the slots in [start, stop) with the filler so they drop their references.
+        
+        :param start: The first slot to clear.
+        :param stop: One past the last slot to clear.
+        """
+        if self._typecode is None:
+            self._data[start:stop] = [_FILLER] * (stop - start)
+        else:
+            self._data[start:stop] = array(self._typecode, bytes(self._data.itemsize * (stop - start)))
+    
+    def _reallocate(self, new_capacity: int) -> None:
+        """
+        Grows or shrinks the storage in place to exactly new_capacity slots.
+        
+        :param new_capacity: The new number of slots (never less than size).
+        """
+        extra = new_capacity - len(self._data)
+        if extra > 0:
+            if self._typecode is None:
+                self._data.extend([_FILLER] * extra)
+            else:
+                self._data.frombytes(bytes(self._data.itemsize * extra))
+        elif extra < 0:
+            del self._data[new_capacity:]
+        self._capacity = new_capacity
+    
     def _adjust_capacity(self, new_capacity: int = 0) -> None:
         """
-        Adjusts the vector's capacity to be at least new_capacity.
+        Adjusts the vector's capacity to be at least new_capacity. The storage at least
+        doubles on every reallocation, so a sequence of appends runs in amortized O(1).
         
         :param new_capacity: The required minimum capacity.
         """
-        while self._capacity < new_capacity:
-            self._capacity *= 2
+        if new_capacity <= self._capacity:
+            return
+        if new_capacity > self._max_size:
+            raise VectorOverflowError(f"Cannot add more elements: max size {self._max_size} exceeded.")
+        self._reallocate(min(max(new_capacity, self._capacity * 2), self._max_size))
+    
+    def reserve(self, new_capacity: int) -> None:
+        """
+        Allocates storage for at least new_capacity elements. Does nothing when the
+        capacity is already large enough.
+        
+        :param new_capacity: The number of elements to make room for.
+        """
+        if new_capacity > self._capacity:
+            if new_capacity > self._max_size:
+                raise VectorOverflowError(f"Cannot reserve {new_capacity} elements: max size {self._max_size} exceeded.")
+            self._reallocate(new_capacity)
+    
+    def shrink_to_fit(self) -> None:
+        """Releases the unused capacity so that capacity equals size."""
+        if self._capacity > self._size:
+            self._reallocate(self._size)
             
     def resize(self, new_size: int, *args: Union[int, float]) -> None:
         """
@@ -59,37 +254,75 @@ class Vector:
         :param new_size: The desired new size of the vector.
         :param args: The new elements to add (must be enough to reach new_size).
         """
-        if new_size < self.size:
-            self._data = self._data[:new_size]
+        size = self._size
+        if new_size < size:
+            self.size = new_size
+            return
+        missing = new_size - size
+        if len(args) < missing:
+            raise IndexError('Not enough default values provided to extend the vector.')
+        self.extend(args[:missing])
+        
+    def extend(self, iterable: Iterable) -> None:
+        """
+        Appends every element of iterable, growing the storage at most once.
+        
+        :param iterable: The elements to append.
+        """
+        if isinstance(iterable, Vector):
+            values = iterable._elements()
+        elif hasattr(iterable, '__len__'):
+            values = iterable
         else:
-            if new_size > self.capacity:
-                self._adjust_capacity(new_size)
-            additional_elements = list(args)[:new_size - self.size]
-            if len(additional_elements) < (new_size - self.size):
-                raise IndexError('Not enough default values provided to extend the vector.')
-            self._data.extend(additional_elements)
-        self.size = new_size
+            iterator = iter(iterable)
+            while block := list(islice(iterator, STREAM_CHUNK)):
+                self.extend(block)
+            return
+        count = len(values)
+        if not count:
+            return
+        if _storage_root(values) is _storage_root(self._data):
+            # v.extend(v) or a window onto this storage: copy the elements before the
+            # reallocation below grows the very object they are read from.
+            values = values[:count] if isinstance(values, (list, array)) else list(values)
+        size = self._size
+        new_size = size + count
+        self._adjust_capacity(new_size)
+        self.invalidate()
+        if self._typecode is None:
+            self._data[size:new_size] = values
+        elif isinstance(values, array) and values.typecode == self._typecode:
+            self._data[size:new_size] = values
+        else:
+            self._data[size:new_size] = array(self._typecode, values)
+        self._size = new_size
         
     def is_empty(self) -> bool:
         """Returns True if the vector is empty."""
         return self.size == 0
     
     def clear(self) -> None:
-        """Clears all elements from the vector and resets its capacity."""
-        self._data.clear()
-        self.size = 0
-        self._capacity = 1
+        """Clears all elements from the vector and releases its storage."""
+        self.invalidate()
+        self._size = 0
+        self._reallocate(0)
         
     def push_back(self, elem: Union[int, float]) -> None:
-        """Appends an element to the end of the vector."""
-        self.resize(self.size + 1, elem)
+        """Appends an element to the end of the vector in amortized O(1)."""
+        size = self._size
+        if size == self._capacity:
+            self._adjust_capacity(size + 1)
+        self._epoch[0] += 1  # invalidate(), inlined on the hot path
+        self._data[size] = elem
+        self._size = size + 1
         
     def pop_back(self) -> None:
         """Removes the last element of the vector."""
         if self.is_empty():
             raise IndexError('Cannot pop from an empty vector.')
-        self._data.pop()
-        self.size -= 1
+        self._epoch[0] += 1
+        self._size -= 1
+        self._data[self._size] = _FILLER
         
     def insert(self, index: int, elem: Union[int, float]) -> None:
         """
@@ -98,10 +331,19 @@ class Vector:
         :param index: The index at which to insert the element.
         :param elem: The element to insert.
         """
-        if index < 0 or index > self.size:
+        size = self._size
+        if index < 0 or index > size:
             raise IndexError('Index out of range.')
-        self._data.insert(index, elem)
-        self.size += 1
+        if self._typecode is not None:
+            # Convert first, so an element the typecode rejects raises before anything moves.
+            elem = array(self._typecode, [elem])[0]
+        if size == self._capacity:
+            self._adjust_capacity(size + 1)
+        self.invalidate()
+        data = self._data
+        data[index + 1:size + 1] = data[index:size]
+        data[index] = elem
+        self._size = size + 1
         
     def erase(self, index: int) -> None:
         """
@@ -109,10 +351,14 @@ class Vector:
         
         :param index: The index of the element to erase.
         """
-        if index < 0 or index >= self.size:
+        size = self._size
+        if index < 0 or index >= size:
             raise IndexError('Index out of range.')
-        del self._data[index]
-        self.size -= 1
+        self.invalidate()
+        data = self._data
+        data[index:size - 1] = data[index + 1:size]
+        data[size - 1] = _FILLER
+        self._size = size - 1
         
     def swap(self, other: 'Vector') -> None:
         """
@@ -122,21 +368,90 @@ class Vector:
         """
         if not isinstance(other, Vector):
             raise TypeError('Swap operation requires another Vector.')
+        if isinstance(other, (VectorView, FrozenVector)):
+            raise TypeError('Cannot swap with a vector view or a frozen vector.')
+        # The change counters and caches travel with the storage (and its views).
         self._data, other._data = other._data, self._data
-        self.size, other.size = other.size, self.size
+        self._epoch, other._epoch = other._epoch, self._epoch
+        self._cache, other._cache = other._cache, self._cache
+        self._typecode, other._typecode = other._typecode, self._typecode
+        self._size, other._size = other._size, self._size
         self._capacity, other._capacity = other._capacity, self._capacity
         
     def __str__(self) -> str:
         """Returns a human-readable string representation of the vector."""
-        return str(tuple(self._data))
+        return str(tuple(self._elements()))
     
     def __repr__(self) -> str:
         """Returns an unambiguous string representation of the vector."""
-        return f"Vector({', '.join(map(str, self._data))})"
+        elements = self._elements()
+        if self._typecode is None:
+            return f"Vector({', '.join(map(str, elements))})"
+        return f"Vector({', '.join([*map(str, elements), f'typecode={self._typecode!r}'])})"
+    
+    def _holds(self, *operands: Any) -> bool:
+        """
+        Checks whether the results of combining this vector with operands can be written
+        back into its storage. Only integer storage is restrictive: it cannot hold floats.
+        
+        :param operands: Scalars, Vectors or Iterables taking part in the operation.
+        """
+        if self._typecode != 'q':
+            return True
+        for operand in operands:
+            if isinstance(operand, Vector):
+                if operand._typecode == 'd' or (operand._typecode is None
+                                                and not all(isinstance(v, int) for v in operand._elements())):
+                    return False
+            elif isinstance(operand, Iterable):
+                if not all(isinstance(v, int) for v in operand):
+                    return False
+            elif not isinstance(operand, int):
+                return False
+        return True
+    
+    def _inplace_fallback(self, copying: Callable[[], 'Vector']) -> 'Vector':
+        """
+        Called when an in-place operator cannot write its result into the storage. Returns
+        the result of the copying operator, as Python did before the in-place kernels
+        existed. The operator is called here rather than by returning NotImplemented
+        because an unsized operand has already been read into a list.
+        
+        :param copying: Computes the result with the copying operator.
+        """
+        return copying()
+    
+    @staticmethod
+    def _operand_storage(other: Union['Vector', Iterable]) -> Any:
+        """Returns the storage of a Vector operand (possibly with spare slots) or the operand itself."""
+        return other._data if isinstance(other, Vector) else other
+    
+    def _unaliased(self, other: Any) -> Any:
+        """
+        Returns other, or a copy of it when it is another window onto this vector's storage
+        (e.g. s = v[1:]; s += v[:-1]). The in-place kernels read the source while they
+        write, element by element or block by block, so an overlapping source would be
+        read partly after it was overwritten, with a result depending on the backend and
+        the length.
+        
+        :param other: An operand of an in-place operation.
+        """
+        storage = self._operand_storage(other)
+        if storage is self._data or _storage_root(storage) is not _storage_root(self._data):
+            return other
+        if isinstance(other, Vector):
+            return other.copy()
+        return list(other)
+    
+    @staticmethod
+    def _is_stream(other: Any) -> bool:
+        """Returns True for an iterable that cannot report its length, such as a generator."""
+        return not isinstance(other, Vector) and isinstance(other, Iterable) and not hasattr(other, '__len__')
     
     def _validate_operands(self, other: Union['Vector', Iterable]) -> None:
         """
-        Validates that the operand has the same dimensions as this vector.
+        Validates that the operand has the same dimensions as this vector. The length of an
+        unsized iterable is only known once it is exhausted, so _stream checks it instead.
         
         :param other: A Vector or Iterable to validate against.
         """
@@ -144,31 +459,80 @@ class Vector:
             raise TypeError('Operand must be a Vector or Iterable.')
         if isinstance(other, Vector) and self.size != other.size:
             raise DimensionalError('Vectors have different dimensions.')
-        if isinstance(other, Iterable) and self.size != len(other):
+        if not self._is_stream(other) and self.size != len(other):
+            raise DimensionalError('Vectors have different dimensions.')
+    
+    def _buffered(self, other: Any) -> Any:
+        """
+        Materializes an unsized iterable. In-place operations use this so that a length
+        mismatch is detected before any element is overwritten.
+        """
+        return list(other) if self._is_stream(other) else other
+    
+    def _stream(self, other: Iterable) -> Iterator[tuple[Any, list]]:
+        """
+        Reads an unsized iterable STREAM_CHUNK elements at a time and yields each block
+        together with the matching slice of this vector's elements. Raises
+        DimensionalError as soon as the operand turns out shorter or longer.
+        
+        :param other: The iterable operand.
+        """
+        iterator = iter(other)
+        data = self._data
+        size = self._size
+        for start in range(0, size, STREAM_CHUNK):
+            stop = min(start + STREAM_CHUNK, size)
+            block = list(islice(iterator, stop - start))
+            if len(block) != stop - start:
+                raise DimensionalError('Vectors have different dimensions.')
+            yield data[start:stop], block
+        for _ in iterator:
             raise DimensionalError('Vectors have different dimensions.')
     
+    def _stream_map(self, op: Any, other: Iterable) -> 'Vector':
+        """Applies a binary element-wise operation against an unsized iterable, block by block."""
+        values: list = []
+        for elements, block in self._stream(other):
+            values.extend(map(op, elements, block))
+        return self._new(values)
+    
+    def _stream_dot(self, other: Iterable) -> Union[int, float]:
+        """
+        Computes the dot product with an unsized iterable, block by block. The running
+        total is carried from block to block, so the result equals the unchunked sum.
+        """
+        total: Union[int, float] = 0
+        for elements, block in self._stream(other):
+            total = sum(map(mul, elements, block), total)
+        return total
+    
     def __add__(self, other: Union['Vector', Iterable]) -> 'Vector':
         """
         Returns a new vector that is the element-wise sum of this vector and another.
         
         :param other: A Vector or Iterable to add.
         """
+        if isinstance(other, self._deferred_types):
+            return NotImplemented
         self._validate_operands(other)
-        if isinstance(other, Vector):
-            return Vector(*[a + b for a, b in zip(self._data, other._data)])
-        return Vector(*[a + b for a, b in zip(self._data, other)])
+        if self._is_stream(other):
+            return self._stream_map(add, other)
+        other_values = other._elements() if isinstance(other, Vector) else other
+        return self._new(vector_backend.active.add(self._elements(), other_values))
     
     def __iadd__(self, other: Union['Vector', Iterable]) -> 'Vector':
         """
-        Performs in-place element-wise addition.
+        Performs in-place element-wise addition, writing into the existing storage.
         
         :param other: A Vector or Iterable to add.
         """
+        other = self._buffered(other)
         self._validate_operands(other)
-        if isinstance(other, Vector):
-            self._data = [a + b for a, b in zip(self._data, other._data)]
-        else:
-            self._data = [a + b for a, b in zip(self._data, other)]
+        if not self._holds(other):
+            return self._inplace_fallback(lambda: self + other)
+        other = self._unaliased(other)
+        self.invalidate()
+        vector_backend.active.iadd(self._data, self._size, self._operand_storage(other))
         return self
     
     def __sub__(self, other: Union['Vector', Iterable]) -> 'Vector':
@@ -177,22 +541,27 @@ class Vector:
         
         :param other: A Vector or Iterable to subtract.
         """
+        if isinstance(other, self._deferred_types):
+            return NotImplemented
         self._validate_operands(other)
-        if isinstance(other, Vector):
-            return Vector(*[a - b for a, b in zip(self._data, other._data)])
-        return Vector(*[a - b for a, b in zip(self._data, other)])
+        if self._is_stream(other):
+            return self._stream_map(sub, other)
+        other_values = other._elements() if isinstance(other, Vector) else other
+        return self._new(vector_backend.active.sub(self._elements(), other_values))
     
     def __isub__(self, other: Union['Vector', Iterable]) -> 'Vector':
         """
-        Performs in-place element-wise subtraction.
+        Performs in-place element-wise subtraction, writing into the existing storage.
         
         :param other: A Vector or Iterable to subtract.
         """
+        other = self._buffered(other)
         self._validate_operands(other)
-        if isinstance(other, Vector):
-            self._data = [a - b for a, b in zip(self._data, other._data)]
-        else:
-            self._data = [a - b for a, b in zip(self._data, other)]
+        if not self._holds(other):
+            return self._inplace_fallback(lambda: self - other)
+        other = self._unaliased(other)
+        self.invalidate()
+        vector_backend.active.isub(self._data, self._size, self._operand_storage(other))
         return self
     
     def __mul__(self, other: Union[int, float, 'Vector', Iterable]) -> Union['Vector', Union[int, float]]:
@@ -203,16 +572,34 @@ class Vector:
         :param other: A number, Vector, or Iterable.
         """
         if isinstance(other, (int, float)):
-            return Vector(*[a * other for a in self._data])
+            return self._new(vector_backend.active.scale(self._elements(), other))
+        if isinstance(other, self._deferred_types):
+            return NotImplemented
         self._validate_operands(other)
-        if isinstance(other, Vector):
-            return sum(a * b for a, b in zip(self._data, other._data))
-        return sum(a * b for a, b in zip(self._data, other))
+        if self._is_stream(other):
+            return self._stream_dot(other)
+        other_values = other._elements() if isinstance(other, Vector) else other
+        return vector_backend.active.dot(self._elements(), other_values)
     
     def __rmul__(self, other: Union[int, float]) -> 'Vector':
         """Supports scalar multiplication from the left-hand side."""
         return self.__mul__(other)
     
+    def __imul__(self, scalar: Union[int, float]) -> 'Vector':
+        """
+        Multiplies every element by a scalar in place. With a vector operand Python falls
+        back to __mul__, so `v *= w` still rebinds v to the dot product.
+        
+        :param scalar: A number to multiply by.
+        """
+        if not isinstance(scalar, (int, float)):
+            return NotImplemented
+        if not self._holds(scalar):
+            return self._inplace_fallback(lambda: self * scalar)
+        self.invalidate()
+        vector_backend.active.iscale(self._data, self._size, scalar)
+        return self
+    
     def __truediv__(self, scalar: Union[int, float]) -> 'Vector':
         """
         Returns a new vector that is the result of dividing this vector by a scalar.
@@ -221,7 +608,22 @@ class Vector:
         """
         if not isinstance(scalar, (int, float)):
             raise TypeError('Division requires a numeric scalar.')
-        return Vector(*[a / scalar for a in self._data])
+        return self._new(vector_backend.active.truediv(self._elements(), scalar))
+    
+    def __itruediv__(self, scalar: Union[int, float]) -> 'Vector':
+        """
+        Divides every element by a scalar in place. Integer storage cannot hold the
+        quotients, so it falls back to __truediv__.
+        
+        :param scalar: A number to divide by.
+        """
+        if not isinstance(scalar, (int, float)):
+            raise TypeError('Division requires a numeric scalar.')
+        if self._typecode == 'q':
+            return self._inplace_fallback(lambda: self / scalar)
+        self.invalidate()
+        vector_backend.active.itruediv(self._data, self._size, scalar)
+        return self
     
     def __floordiv__(self, scalar: Union[int, float]) -> 'Vector':
         """
@@ -231,24 +633,230 @@ class Vector:
         """
         if not isinstance(scalar, (int, float)):
             raise TypeError('Division requires a numeric scalar.')
-        return Vector(*[a // scalar for a in self._data])
+        return self._new(vector_backend.active.floordiv(self._elements(), scalar))
+    
+    def __ifloordiv__(self, scalar: Union[int, float]) -> 'Vector':
+        """
+        Floor divides every element by a scalar in place.
+        
+        :param scalar: A number to divide by.
+        """
+        if not isinstance(scalar, (int, float)):
+            raise TypeError('Division requires a numeric scalar.')
+        if not self._holds(scalar):
+            return self._inplace_fallback(lambda: self // scalar)
+        self.invalidate()
+        vector_backend.active.ifloordiv(self._data, self._size, scalar)
+        return self
+    
+    def _require_holds(self, *operands: Any) -> None:
+        """Raises TypeError when an explicit in-place method cannot store its results."""
+        if not self._holds(*operands):
+            raise TypeError('Integer storage cannot hold the floating-point results of this operation.')
+    
+    def scale_(self, alpha: Union[int, float]) -> 'Vector':
+        """
+        Multiplies every element by alpha in place (self *= alpha) without allocating.
+        
+        :param alpha: The scalar factor.
+        :return: This vector, for chaining.
+        """
+        if not isinstance(alpha, (int, float)):
+            raise TypeError('Scaling requires a numeric scalar.')
+        self._require_holds(alpha)
+        self.invalidate()
+        vector_backend.active.iscale(self._data, self._size, alpha)
+        return self
+    
+    def axpy(self, alpha: Union[int, float], x: Union['Vector', Iterable]) -> 'Vector':
+        """
+        Adds alpha * x to this vector in place (BLAS axpy: self += alpha * x) without
+        building the scaled copy of x.
+        
+        :param alpha: The scalar factor applied to x.
+        :param x: A Vector or Iterable of the same dimension.
+        :return: This vector, for chaining.
+        """
+        if not isinstance(alpha, (int, float)):
+            raise TypeError('axpy requires a numeric scalar.')
+        x = self._buffered(x)
+        self._validate_operands(x)
+        self._require_holds(alpha, x)
+        x = self._unaliased(x)
+        self.invalidate()
+        vector_backend.active.axpy(self._data, self._size, alpha, self._operand_storage(x))
+        return self
+    
+    def fma_(self, x: Union['Vector', Iterable], y: Union['Vector', Iterable]) -> 'Vector':
+        """
+        Adds the element-wise product of x and y to this vector in place (self += x * y)
+        in a single pass.
+        
+        :param x: A Vector or Iterable of the same dimension.
+        :param y: A Vector or Iterable of the same dimension.
+        :return: This vector, for chaining.
+        """
+        x, y = self._buffered(x), self._buffered(y)
+        self._validate_operands(x)
+        self._validate_operands(y)
+        self._require_holds(x, y)
+        x, y = self._unaliased(x), self._unaliased(y)
+        self.invalidate()
+        vector_backend.active.fma(self._data, self._size, self._operand_storage(x), self._operand_storage(y))
+        return self
     
     def __eq__(self, other: Any) -> bool:
         """Checks whether two vectors are equal."""
+        if isinstance(other, self._deferred_types):
+            return NotImplemented
         if not isinstance(other, Vector):
+            return NotImplemented  # Lets small vectors compare themselves; otherwise False.
+        if self.size != other.size:
             return False
-        return self._data == other._data
+        elements, other_elements = self._elements(), other._elements()
+        if self._typecode is None and other._typecode is None and type(elements) is type(other_elements):
+            return elements == other_elements
+        return all(a == b for a, b in zip(elements, other_elements))
     
-    def __getitem__(self, index: int) -> Union[int, float]:
+    def _slice_storage(self, index: slice) -> Union[memoryview, '_StridedList']:
         """
-        Returns the element at the given index.
+        Returns the storage of the elements selected by a slice without copying them.
         
-        :param index: The index of the element.
+        :param index: A slice of the live elements.
         """
+        if self._typecode is not None:
+            return memoryview(self._data)[:self._size][index]
+        if isinstance(self._data, _StridedList):
+            return self._data[index]
+        return _StridedList(self._data, range(self._size)[index])
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[int, float, 'VectorView']:
+        """
+        Returns the element at the given index. A slice (with any step) returns a
+        VectorView that shares this vector's storage: writes and in-place arithmetic on
+        the view change this vector. Use copy() for an independent vector.
+        
+        :param index: The index of the element, or a slice.
+        """
+        if isinstance(index, slice):
+            return VectorView(self._slice_storage(index), self._typecode, self)
         if index < 0 or index >= self.size:
             raise IndexError('Index out of range.')
         return self._data[index]
     
+    def __setitem__(self, index: Union[int, slice], value: Union[int, float, 'Vector', Iterable]) -> None:
+        """
+        Replaces the element at the given index, or every element selected by a slice.
+        Slice assignment cannot change the size of the vector.
+        
+        :param index: The index of the element, or a slice.
+        :param value: The new value, or a Vector or Iterable with one value per selected element.
+        """
+        if isinstance(index, slice):
+            target = self._slice_storage(index)
+            values = value._elements() if isinstance(value, Vector) else value
+            if not hasattr(values, '__len__'):
+                values = list(values)
+            if len(values) != len(target):
+                raise DimensionalError('Slice assignment cannot change the size of the vector.')
+            self.invalidate()
+            target[:] = list(values) if self._typecode is None else array(self._typecode, values)
+            return
+        if index < 0 or index >= self.size:
+            raise IndexError('Index out of range.')
+        self.invalidate()
+        self._data[index] = value
+    
+    def copy(self) -> 'Vector':
+        """
+        Returns an independent Vector with the same elements and kind of storage. Use it
+        to detach a slice view from the storage it shares.
+        """
+        elements = self._elements()
+        if self._typecode is None:
+            return Vector._from_storage(list(elements))
+        return Vector._from_storage(array(self._typecode, elements.tobytes()), self._typecode)
+    
+    def __iter__(self) -> Iterator[Union[int, float]]:
+        """Iterates over the elements of the vector."""
+        return islice(self._data, self._size)
+    
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Writes the vector to path in the compact binary format (16-byte header followed by
+        the raw little-endian elements). List-backed vectors are stored as 'q' when every
+        element is an integer and as 'd' otherwise.
+        
+        :param path: The destination file.
+        """
+        typecode = self._typecode or _infer_typecode(self._elements())
+        if self._typecode is None:
+            payload = array(typecode, self._elements())
+        else:
+            payload = self.data()
+            if not payload.contiguous:
+                payload = array(typecode, payload.tobytes())
+        if sys.byteorder != 'little':
+            payload = array(typecode, payload)
+            payload.byteswap()
+        with open(path, 'wb') as file:
+            file.write(_FILE_HEADER.pack(_FILE_MAGIC, typecode.encode(), self._size))
+            file.write(payload)
+    
+    @staticmethod
+    def _read_header(header: bytes, path: Union[str, os.PathLike]) -> tuple[str, int]:
+        """
+        Validates a file header and returns (typecode, length).
+        
+        :param header: The first bytes of the file.
+        :param path: The file name, for error messages.
+        """
+        if len(header) < _FILE_HEADER.size:
+            raise ValueError(f'{path} is too short to be a vector file.')
+        magic, typecode, length = _FILE_HEADER.unpack_from(header)
+        typecode = typecode.decode('ascii', 'replace')
+        if magic != _FILE_MAGIC or typecode not in TYPECODES:
+            raise ValueError(f'{path} is not a vector file.')
+        return typecode, length
+    
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> 'Vector':
+        """
+        Reads a vector written by save() into a typed vector.
+        
+        :param path: The source file.
+        """
+        with open(path, 'rb') as file:
+            typecode, length = cls._read_header(file.read(_FILE_HEADER.size), path)
+            data = array(typecode)
+            try:
+                data.fromfile(file, length)
+            except EOFError:
+                raise ValueError(f'{path} is truncated: expected {length} elements.') from None
+        if sys.byteorder != 'little':
+            data.byteswap()
+        return Vector._from_storage(data, typecode)
+    
+    @staticmethod
+    def mmap(path: Union[str, os.PathLike], writable: bool = True) -> 'MappedVector':
+        """
+        Opens a vector file written by save() as a memory-mapped, fixed-size vector.
+        Opening takes constant time; element reads and in-place arithmetic only touch the
+        pages they need, and writes go straight to the file.
+        
+        :param path: The vector file.
+        :param writable: False maps the file read-only.
+        """
+        return MappedVector(path, writable)
+    
+    def lazy(self) -> 'LazyVector':
+        """
+        Returns a deferred view of this vector. Arithmetic on it builds an expression that
+        is evaluated in one fused pass, without intermediate vectors (see vector_lazy).
+        """
+        from vector_lazy import LazyVector
+        return LazyVector.leaf(self)
+    
     def __len__(self) -> int:
         """Returns the number of elements in the vector."""
         return self.size
@@ -259,7 +867,17 @@ class Vector:
     
     def __neg__(self) -> 'Vector':
         """Returns a new vector that is the negation of this vector."""
-        return Vector(*[-a for a in self._data])
+        return self._new(vector_backend.active.neg(self._elements()))
+    
+    def neg_(self) -> 'Vector':
+        """
+        Negates every element in place (Python has no __ineg__ hook).
+        
+        :return: This vector, for chaining.
+        """
+        self.invalidate()
+        vector_backend.active.ineg(self._data, self._size)
+        return self
     
     def __abs__(self) -> float:
         """
@@ -267,7 +885,300 @@ class Vector:
         
         :return: sqrt(a1^2 + a2^2 + ... + an^2)
         """
-        return sum(a ** 2 for a in self._data) ** 0.5
+        return self._cached('l2', lambda: vector_backend.active.norm(self._elements()))
+    
+    def norm(self, p: Union[int, float] = 2) -> Union[int, float]:
+        """
+        Returns the p-norm of the vector. Like abs(), the result is cached until the
+        vector changes.
+        
+        :param p: 1, 2 or float('inf').
+        """
+        if p == 2:
+            return abs(self)
+        if p == 1:
+            return self._cached('l1', lambda: sum(map(abs, self._elements())))
+        if p == float('inf'):
+            return self._cached('linf', lambda: max(map(abs, self._elements()), default=0))
+        raise ValueError('Only the 1, 2 and infinity norms are supported.')
+    
+    def sum(self) -> Union[int, float]:
+        """Returns the sum of the elements, cached until the vector changes."""
+        return self._cached('sum', lambda: sum(self._elements()))
+    
+    def _cached(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Returns a derived value, computing it only if the elements changed since it was
+        last stored. Every mutating method advances the change counter, which views share
+        with their owner, so stale entries are never returned.
+        
+        :param key: The name of the derived value.
+        :param compute: Computes the value from the current elements.
+        """
+        epoch = self._epoch[0]
+        cache = self._cache
+        if cache is None or cache[0] != epoch:
+            cache = self._cache = (epoch, {})
+        values = cache[1]
+        if key not in values:
+            values[key] = compute()
+        return values[key]
+    
+    def invalidate(self) -> None:
+        """
+        Drops the cached norms and sums of this vector and of every view sharing its
+        storage. Mutating methods call this themselves; call it after writing through
+        data(), the buffer protocol or a NumPy array.
+        """
+        self._epoch[0] += 1
+    
+    def freeze(self) -> 'FrozenVector':
+        """Returns an immutable, hashable copy of this vector."""
+        return FrozenVector._freeze(self)
+
+class _StridedList:
+    """
+    A fixed-length window over every step-th slot of a list: the list-storage counterpart
+    of a sliced memoryview. Reads and writes go to the underlying list.
+    """
+    
+    __slots__ = ('_list', '_range')
+    
+    def __init__(self, data: list, indices: range) -> None:
+        """
+        Wraps the given positions of data without copying.
+        
+        :param data: The list that owns the elements.
+        :param indices: The positions in data covered by the window.
+        """
+        self._list = data
+        self._range = indices
+    
+    def __len__(self) -> int:
+        """Returns the number of positions in the window."""
+        return len(self._range)
+    
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """Returns an element, or a narrower window for a slice."""
+        if isinstance(index, slice):
+            return _StridedList(self._list, self._range[index])
+        return self._list[self._range[index]]
+    
+    def __setitem__(self, index: Union[int, slice], value: Any) -> None:
+        """Replaces an element, or as many elements as a slice selects."""
+        if not isinstance(index, slice):
+            self._list[self._range[index]] = value
+            return
+        positions = self._range[index]
+        values = list(value)  # Copy first: value may be a window over the same list.
+        if len(values) != len(positions):
+            raise ValueError('Slice assignment cannot change the length of a strided window.')
+        for position, item in zip(positions, values):
+            self._list[position] = item
+    
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over the elements in window order."""
+        indices = self._range
+        if indices.step == 1:
+            return islice(self._list, indices.start, indices.stop)
+        return map(self._list.__getitem__, indices)
+    
+    def __eq__(self, other: Any) -> bool:
+        """Compares the elements with a list or another window."""
+        if isinstance(other, (list, _StridedList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+class VectorView(Vector):
+    """
+    A fixed-size vector whose elements live in storage owned by another object, such as
+    a row of a VectorBatch or a slice of a Vector. Reads, writes and arithmetic go straight
+    to the shared storage; operations that would change the size raise TypeError.
+    """
+    
+    def __init__(self, data: Union[memoryview, list], typecode: Optional[str], base: Any = None) -> None:
+        """
+        Wraps shared storage without copying it.
+        
+        :param data: A memoryview (typed storage, possibly strided) or mutable sequence
+                     holding the elements.
+        :param typecode: The typecode of data, or None for Python objects.
+        :param base: The owner of the storage, kept alive as long as the view.
+        """
+        self._size = len(data)
+        self._max_size = self._size
+        self._capacity = self._size
+        self._typecode = typecode
+        self._data = data
+        self._base = base
+        # Views share the change counter of their owner, so a write through either side
+        # invalidates the cached values of both.
+        self._epoch = getattr(base, '_epoch', None) or [0]
+        self._cache = None
+    
+    def _resize_error(self, *args: Any) -> None:
+        """Rejects every operation that would change the size of the view."""
+        raise TypeError('Cannot change the size of a vector view; copy it into a Vector first.')
+    
+    push_back = pop_back = insert = erase = resize = extend = clear = swap = _resize_error
+    
+    @property
+    def size(self) -> int:
+        """Returns the number of elements in the view."""
+        return self._size
+    
+    def reserve(self, new_capacity: int) -> None:
+        """Views cannot grow, so only a no-op reservation is accepted."""
+        if new_capacity > self._capacity:
+            self._resize_error()
+    
+    def shrink_to_fit(self) -> None:
+        """A view never has spare capacity."""
+    
+    def _inplace_fallback(self, copying: Callable[[], 'Vector']) -> 'Vector':
+        """A copying fallback would detach the result from the shared storage, so refuse it."""
+        raise TypeError('Integer storage of this view cannot hold the floating-point results in place.')
+    
+    def __repr__(self) -> str:
+        """Returns an unambiguous string representation of the view."""
+        return 'VectorView' + super().__repr__()[len('Vector'):]
+
+class FrozenVector(Vector):
+    """
+    An immutable Vector. It is hashable, so it can serve as a dict key or set member, for
+    instance to memoize results computed from a vector; the hash is computed once. Its
+    norms and sum are cached for its whole lifetime. Arithmetic returns ordinary
+    Vectors, and `+=` and friends rebind the name to a new Vector, as they do for tuples.
+    """
+    
+    def __init__(self, *args: Union[int, float], typecode: Optional[str] = None) -> None:
+        """
+        Constructs a frozen vector with the provided elements.
+        
+        :param args: The elements of the vector.
+        :param typecode: As in the Vector constructor.
+        """
+        super().__init__(*args, typecode=typecode)
+        if self._typecode is None:
+            self._data = tuple(self._data)
+        self._hash: Optional[int] = None
+    
+    @classmethod
+    def _freeze(cls, vector: Vector) -> 'FrozenVector':
+        """Copies the elements of vector into a new frozen vector."""
+        elements = vector._elements()
+        if vector._typecode is None:
+            data = tuple(elements)
+        else:
+            data = array(vector._typecode, elements.tobytes())
+        frozen = cls._from_storage(data, vector._typecode)
+        frozen._hash = None
+        return frozen
+    
+    @classmethod
+    def from_iter(cls, iterable: Iterable, chunk: int = STREAM_CHUNK, typecode: Optional[str] = None) -> 'FrozenVector':
+        """Builds a frozen vector from any iterable (see Vector.from_iter)."""
+        return cls._freeze(Vector.from_iter(iterable, chunk, typecode))
+    
+    def _immutable(self, *args: Any) -> None:
+        """Rejects every operation that would modify the vector."""
+        raise TypeError('FrozenVector is immutable; use copy() for a mutable Vector.')
+    
+    push_back = pop_back = insert = erase = resize = extend = clear = swap = _immutable
+    reserve = shrink_to_fit = scale_ = axpy = fma_ = neg_ = __setitem__ = _immutable
+    
+    @property
+    def size(self) -> int:
+        """Returns the number of elements."""
+        return self._size
+    
+    def data(self) -> memoryview:
+        """Returns a read-only memoryview over the elements of a typed frozen vector."""
+        return super().data().toreadonly()
+    
+    def _slice_storage(self, index: slice) -> Union[memoryview, '_StridedList']:
+        """Slices are read-only as well: tuple storage rejects writes and memoryviews are made read-only."""
+        storage = super()._slice_storage(index)
+        return storage.toreadonly() if isinstance(storage, memoryview) else storage
+    
+    def __iadd__(self, other: Union[Vector, Iterable]) -> Vector:
+        """Returns self + other."""
+        return self + other
+    
+    def __isub__(self, other: Union[Vector, Iterable]) -> Vector:
+        """Returns self - other."""
+        return self - other
+    
+    def __imul__(self, other: Union[int, float, Vector, Iterable]) -> Union[Vector, int, float]:
+        """Returns self * other."""
+        return self * other
+    
+    def __itruediv__(self, scalar: Union[int, float]) -> Vector:
+        """Returns self / scalar."""
+        return self / scalar
+    
+    def __ifloordiv__(self, scalar: Union[int, float]) -> Vector:
+        """Returns self // scalar."""
+        return self // scalar
+    
+    def __hash__(self) -> int:
+        """Returns the hash of the elements, computed on first use. Equal vectors hash equally."""
+        if self._hash is None:
+            self._hash = hash(tuple(self._elements()))
+        return self._hash
+    
+    def __repr__(self) -> str:
+        """Returns an unambiguous string representation of the frozen vector."""
+        return 'FrozenVector' + super().__repr__()[len('Vector'):]
+
+class MappedVector(VectorView):
+    """
+    A fixed-size vector whose elements live in a memory-mapped vector file (see
+    Vector.save and Vector.mmap). Use it as a context manager, or call close(), to
+    release the mapping.
+    """
+    
+    def __init__(self, path: Union[str, os.PathLike], writable: bool = True) -> None:
+        """
+        Maps the file at path.
+        
+        :param path: A file written by Vector.save.
+        :param writable: False maps the file read-only.
+        """
+        if sys.byteorder != 'little':
+            raise ValueError('Memory-mapped vectors require a little-endian platform.')
+        with open(path, 'r+b' if writable else 'rb') as file:
+            typecode, length = Vector._read_header(file.read(_FILE_HEADER.size), path)
+            end = _FILE_HEADER.size + length * array(typecode).itemsize
+            if os.fstat(file.fileno()).st_size < end:
+                raise ValueError(f'{path} is truncated: expected {length} elements.')
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        super().__init__(memoryview(mapping)[_FILE_HEADER.size:end].cast(typecode), typecode, mapping)
+    
+    def flush(self) -> None:
+        """Writes modified pages back to the file."""
+        self._base.flush()
+    
+    def close(self) -> None:
+        """Flushes and unmaps the file. The vector must not be used afterwards."""
+        if self._base.closed:
+            return
+        if not self._data.readonly:
+            self._base.flush()
+        self._data.release()
+        self._base.close()
+    
+    def __enter__(self) -> 'MappedVector':
+        """Returns the mapped vector itself."""
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        """Closes the mapping."""
+        self.close()
+    
+    def __repr__(self) -> str:
+        """Returns an unambiguous string representation of the mapped vector."""
+        return 'MappedVector' + Vector.__repr__(self)[len('Vector'):]
 
 # Example usage
 if __name__ == '__main__':
@@ -0,0 +1,223 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+from typing import Callable, Optional
+
+import vector_backend
+from Vector import Vector
+
+# Vector lengths benchmarked by default.
+SIZES = (10, 1_000, 100_000, 10_000_000)
+
+# Storage kinds: list-backed (typecode None) and contiguous doubles.
+STORAGES = {'list': None, 'd': 'd'}
+
+# A case is considered a regression when it is this much slower than the baseline.
+THRESHOLD = 0.10
+
+def _values(n: int, typecode: Optional[str]) -> list:
+    """Returns n deterministic elements of the type a vector with typecode holds."""
+    return [float(i % 1000) for i in range(n)] if typecode else [i % 1000 for i in range(n)]
+
+def _construct(n: int, typecode: Optional[str]) -> Callable[[], object]:
+    """Vector(*values) with n values."""
+    values = _values(n, typecode)
+    return lambda: Vector(*values, typecode=typecode)
+
+def _from_iter(n: int, typecode: Optional[str]) -> Callable[[], object]:
+    """Vector.from_iter over an iterator of n values."""
+    values = _values(n, typecode)
+    return lambda: Vector.from_iter(iter(values), typecode=typecode)
+
+def _push_back(n: int, typecode: Optional[str]) -> Callable[[], None]:
+    """Grows an empty vector to n elements with push_back."""
+    values = _values(n, typecode)
+
+    def run() -> None:
+        vector = Vector(typecode=typecode)
+        push_back = vector.push_back
+        for value in values:
+            push_back(value)
+    return run
+
+def _extend(n: int, typecode: Optional[str]) -> Callable[[], None]:
+    """Grows an empty vector to n elements with one extend."""
+    values = _values(n, typecode)
+
+    def run() -> None:
+        Vector(typecode=typecode).extend(values)
+    return run
+
+def _binary(op: Callable) -> Callable:
+    """Builds a case that applies op to two vectors of length n."""
+    def factory(n: int, typecode: Optional[str]) -> Callable[[], object]:
+        a = Vector(*_values(n, typecode), typecode=typecode)
+        b = Vector(*_values(n, typecode), typecode=typecode)
+        return lambda: op(a, b)
+    return factory
+
+def _unary(op: Callable) -> Callable:
+    """Builds a case that applies op to one vector of length n."""
+    def factory(n: int, typecode: Optional[str]) -> Callable[[], object]:
+        a = Vector(*_values(n, typecode), typecode=typecode)
+        return lambda: op(a)
+    return factory
+
+def _iadd(a: Vector, b: Vector) -> None:
+    """In-place addition (an operator statement cannot appear in a lambda)."""
+    a += b
+
+def _insert_erase(position: str) -> Callable:
+    """
+    Builds a case that inserts one element and erases it again, so the length stays n
+    however many times the case runs.
+
+    :param position: 'front', 'middle' or 'back'.
+    """
+    def factory(n: int, typecode: Optional[str]) -> Callable[[], None]:
+        vector = Vector(*_values(n, typecode), typecode=typecode)
+        index = {'front': 0, 'middle': n // 2, 'back': n}[position]
+
+        def run() -> None:
+            vector.insert(index, 1)
+            vector.erase(index)
+        return run
+    return factory
+
+def _swap(n: int, typecode: Optional[str]) -> Callable[[], None]:
+    """Swaps two vectors of length n."""
+    a = Vector(*_values(n, typecode), typecode=typecode)
+    b = Vector(*_values(n, typecode), typecode=typecode)
+    return lambda: a.swap(b)
+
+# name -> factory(n, typecode) returning the zero-argument callable to time.
+BENCHMARKS: dict[str, Callable] = {
+    'construct': _construct,
+    'from_iter': _from_iter,
+    'push_back': _push_back,
+    'extend': _extend,
+    'add': _binary(lambda a, b: a + b),
+    'sub': _binary(lambda a, b: a - b),
+    'iadd': _binary(_iadd),
+    'scale': _unary(lambda a: a * 3),
+    'neg': _unary(lambda a: -a),
+    'dot': _binary(lambda a, b: a * b),
+    'norm': _unary(abs),
+    'insert_erase_front': _insert_erase('front'),
+    'insert_erase_middle': _insert_erase('middle'),
+    'insert_erase_back': _insert_erase('back'),
+    'swap': _swap,
+}
+
+def measure(func: Callable[[], object], repeat: int) -> float:
+    """
+    Returns the best time per call in seconds. The number of calls per sample is chosen
+    by timeit's autorange (at least 0.2 s per sample), and the fastest of repeat samples
+    is kept because slower samples only measure interference from other processes.
+
+    :param func: The callable to time.
+    :param repeat: The number of samples.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+def run(sizes: tuple = SIZES, names: Optional[list] = None, repeat: int = 3, verbose: bool = True) -> dict:
+    """
+    Runs the benchmarks and returns the results document.
+
+    :param sizes: The vector lengths.
+    :param names: The benchmark names to run (default: all).
+    :param repeat: Samples per case.
+    :param verbose: Print each result as it is measured.
+    :return: {'meta': {...}, 'results': {'name/storage/size': seconds per call}}.
+    """
+    results = {}
+    for name in names or BENCHMARKS:
+        for storage, typecode in STORAGES.items():
+            for size in sizes:
+                key = f'{name}/{storage}/{size}'
+                seconds = measure(BENCHMARKS[name](size, typecode), repeat)
+                results[key] = seconds
+                if verbose:
+                    print(f'{key:<36} {seconds * 1e6:14.3f} us', flush=True)
+    meta = {
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'backend': vector_backend.get_backend(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'repeat': repeat,
+    }
+    return {'meta': meta, 'results': results}
+
+def compare(baseline: dict, current: dict, threshold: float = THRESHOLD) -> list:
+    """
+    Compares two results documents case by case.
+
+    :param baseline: The stored results.
+    :param current: The new results.
+    :param threshold: The relative slowdown above which a case counts as a regression.
+    :return: (key, baseline seconds, current seconds, ratio) for every regression.
+    """
+    regressions = []
+    print(f"{'case':<36} {'baseline us':>14} {'current us':>14} {'ratio':>7}")
+    for key, seconds in current['results'].items():
+        old = baseline['results'].get(key)
+        if old is None:
+            print(f'{key:<36} {"-":>14} {seconds * 1e6:14.3f}     new')
+            continue
+        ratio = seconds / old if old else float('inf')
+        flag = ''
+        if ratio > 1 + threshold:
+            flag = '  REGRESSION'
+            regressions.append((key, old, seconds, ratio))
+        elif ratio < 1 - threshold:
+            flag = '  faster'
+        print(f'{key:<36} {old * 1e6:14.3f} {seconds * 1e6:14.3f} {ratio:7.2f}{flag}')
+    return regressions
+
+def main(argv: Optional[list] = None) -> int:
+    """Command-line entry point; returns 1 when a regression is found."""
+    parser = argparse.ArgumentParser(description='Benchmarks for the Vector module (standard library only).')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES), help='vector lengths to benchmark')
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), help='run only these benchmarks')
+    parser.add_argument('--repeat', type=int, default=3, help='samples per case; the fastest is kept')
+    parser.add_argument('--backend', choices=('python', 'numpy', 'auto'), default='auto',
+                        help='Vector backend to benchmark')
+    parser.add_argument('-o', '--output', help='write the results as JSON to this file')
+    parser.add_argument('--baseline', help='compare the new results against this JSON file')
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'),
+                        help='compare two stored JSON files without running anything')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help='relative slowdown reported as a regression (default: 0.10)')
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0]) as file:
+            baseline = json.load(file)
+        with open(args.compare[1]) as file:
+            current = json.load(file)
+    else:
+        vector_backend.set_backend(args.backend)
+        current = run(tuple(args.sizes), args.only, args.repeat)
+        if args.output:
+            with open(args.output, 'w') as file:
+                json.dump(current, file, indent=2)
+        if not args.baseline:
+            return 0
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f'{len(regressions)} regression(s) above {args.threshold:.0%}.')
+        return 1
+    print('No regressions.')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
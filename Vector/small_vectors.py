@@ -0,0 +1,431 @@
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from Vector import DimensionalError, Vector
+
+Number = Union[int, float]
+
+class _SmallVector:
+    """
+    Shared behaviour of the fixed-dimension vectors. Subclasses store their components in
+    __slots__ (no per-object __dict__, size fields or list) and implement the hot operators
+    with the loops unrolled. Operands of the same class skip validation entirely; anything
+    else goes through _components, which applies the same rules as Vector.
+
+    The results follow list-backed Vector semantics: element-wise operators return the
+    class of the left operand, `*` with a vector is the dot product, and in-place operators
+    mutate the object.
+    """
+
+    __slots__ = ()
+
+    # Number of components, set by each subclass.
+    _dim: int = 0
+
+    def _components(self, other: Union[Vector, Iterable]) -> tuple:
+        """
+        Validates an operand of another type and returns its components.
+
+        :param other: A Vector, small vector or Iterable of the same dimension.
+        """
+        if not isinstance(other, (Vector, _SmallVector, Iterable)):
+            raise TypeError('Operand must be a Vector or Iterable.')
+        if len(other) != self._dim:
+            raise DimensionalError('Vectors have different dimensions.')
+        return tuple(other)
+
+    @staticmethod
+    def _check_scalar(scalar: Any) -> None:
+        """Raises the same TypeError as Vector division with a non-numeric operand."""
+        if not isinstance(scalar, (int, float)):
+            raise TypeError('Division requires a numeric scalar.')
+
+    def __len__(self) -> int:
+        """Returns the number of components."""
+        return self._dim
+
+    def __bool__(self) -> bool:
+        """Small vectors are never empty."""
+        return True
+
+    def __getitem__(self, index: int) -> Number:
+        """
+        Returns the component at the given index.
+
+        :param index: 0 <= index < dimension.
+        """
+        if index < 0 or index >= self._dim:
+            raise IndexError('Index out of range.')
+        return getattr(self, self.__slots__[index])
+
+    def __setitem__(self, index: int, value: Number) -> None:
+        """
+        Replaces the component at the given index.
+
+        :param index: 0 <= index < dimension.
+        :param value: The new value.
+        """
+        if index < 0 or index >= self._dim:
+            raise IndexError('Index out of range.')
+        setattr(self, self.__slots__[index], value)
+
+    def __eq__(self, other: Any) -> bool:
+        """Checks component-wise equality with another small vector or a Vector."""
+        if isinstance(other, (_SmallVector, Vector)):
+            return len(other) == self._dim and tuple(self) == tuple(other)
+        return NotImplemented
+
+    __hash__ = None  # Mutable, like Vector.
+
+    def __str__(self) -> str:
+        """Returns a human-readable string representation, the same as Vector's."""
+        return str(tuple(self))
+
+    def __repr__(self) -> str:
+        """Returns an unambiguous string representation of the vector."""
+        return f"{type(self).__name__}({', '.join(map(repr, self))})"
+
+    def to_vector(self, typecode: Optional[str] = None) -> Vector:
+        """
+        Returns the components as a general Vector.
+
+        :param typecode: The storage of the result, as in the Vector constructor.
+        """
+        return Vector(*self, typecode=typecode)
+
+class Vec2(_SmallVector):
+    """A two-dimensional vector (x, y)."""
+
+    __slots__ = ('x', 'y')
+    _dim = 2
+
+    def __init__(self, x: Number = 0, y: Number = 0) -> None:
+        """
+        Constructs the vector (x, y).
+
+        :param x: The first component.
+        :param y: The second component.
+        """
+        self.x = x
+        self.y = y
+
+    def __iter__(self) -> Iterator[Number]:
+        """Iterates over the components."""
+        return iter((self.x, self.y))
+
+    def __add__(self, other: Union['Vec2', Vector, Iterable]) -> 'Vec2':
+        """Returns the component-wise sum."""
+        if other.__class__ is Vec2:
+            return Vec2(self.x + other.x, self.y + other.y)
+        x, y = self._components(other)
+        return Vec2(self.x + x, self.y + y)
+
+    def __iadd__(self, other: Union['Vec2', Vector, Iterable]) -> 'Vec2':
+        """Adds other component-wise in place."""
+        if other.__class__ is not Vec2:
+            other = Vec2(*self._components(other))
+        self.x += other.x
+        self.y += other.y
+        return self
+
+    def __sub__(self, other: Union['Vec2', Vector, Iterable]) -> 'Vec2':
+        """Returns the component-wise difference."""
+        if other.__class__ is Vec2:
+            return Vec2(self.x - other.x, self.y - other.y)
+        x, y = self._components(other)
+        return Vec2(self.x - x, self.y - y)
+
+    def __isub__(self, other: Union['Vec2', Vector, Iterable]) -> 'Vec2':
+        """Subtracts other component-wise in place."""
+        if other.__class__ is not Vec2:
+            other = Vec2(*self._components(other))
+        self.x -= other.x
+        self.y -= other.y
+        return self
+
+    def __mul__(self, other: Union[Number, 'Vec2', Vector, Iterable]) -> Union['Vec2', Number]:
+        """Scalar multiplication, or the dot product with a vector operand."""
+        if isinstance(other, (int, float)):
+            return Vec2(self.x * other, self.y * other)
+        if other.__class__ is Vec2:
+            return self.x * other.x + self.y * other.y
+        x, y = self._components(other)
+        return self.x * x + self.y * y
+
+    def __rmul__(self, other: Number) -> Union['Vec2', Number]:
+        """Supports scalar multiplication from the left-hand side."""
+        return self.__mul__(other)
+
+    def __imul__(self, scalar: Number) -> 'Vec2':
+        """Multiplies both components by a scalar in place."""
+        if not isinstance(scalar, (int, float)):
+            return NotImplemented
+        self.x *= scalar
+        self.y *= scalar
+        return self
+
+    def __truediv__(self, scalar: Number) -> 'Vec2':
+        """Returns the vector divided by a scalar."""
+        self._check_scalar(scalar)
+        return Vec2(self.x / scalar, self.y / scalar)
+
+    def __itruediv__(self, scalar: Number) -> 'Vec2':
+        """Divides both components by a scalar in place."""
+        self._check_scalar(scalar)
+        self.x /= scalar
+        self.y /= scalar
+        return self
+
+    def __floordiv__(self, scalar: Number) -> 'Vec2':
+        """Returns the vector floor divided by a scalar."""
+        self._check_scalar(scalar)
+        return Vec2(self.x // scalar, self.y // scalar)
+
+    def __ifloordiv__(self, scalar: Number) -> 'Vec2':
+        """Floor divides both components by a scalar in place."""
+        self._check_scalar(scalar)
+        self.x //= scalar
+        self.y //= scalar
+        return self
+
+    def __neg__(self) -> 'Vec2':
+        """Returns the negated vector."""
+        return Vec2(-self.x, -self.y)
+
+    def __abs__(self) -> float:
+        """Returns the Euclidean norm."""
+        return (self.x ** 2 + self.y ** 2) ** 0.5
+
+class Vec3(_SmallVector):
+    """A three-dimensional vector (x, y, z)."""
+
+    __slots__ = ('x', 'y', 'z')
+    _dim = 3
+
+    def __init__(self, x: Number = 0, y: Number = 0, z: Number = 0) -> None:
+        """
+        Constructs the vector (x, y, z).
+
+        :param x: The first component.
+        :param y: The second component.
+        :param z: The third component.
+        """
+        self.x = x
+        self.y = y
+        self.z = z
+
+    def __iter__(self) -> Iterator[Number]:
+        """Iterates over the components."""
+        return iter((self.x, self.y, self.z))
+
+    def __add__(self, other: Union['Vec3', Vector, Iterable]) -> 'Vec3':
+        """Returns the component-wise sum."""
+        if other.__class__ is Vec3:
+            return Vec3(self.x + other.x, self.y + other.y, self.z + other.z)
+        x, y, z = self._components(other)
+        return Vec3(self.x + x, self.y + y, self.z + z)
+
+    def __iadd__(self, other: Union['Vec3', Vector, Iterable]) -> 'Vec3':
+        """Adds other component-wise in place."""
+        if other.__class__ is not Vec3:
+            other = Vec3(*self._components(other))
+        self.x += other.x
+        self.y += other.y
+        self.z += other.z
+        return self
+
+    def __sub__(self, other: Union['Vec3', Vector, Iterable]) -> 'Vec3':
+        """Returns the component-wise difference."""
+        if other.__class__ is Vec3:
+            return Vec3(self.x - other.x, self.y - other.y, self.z - other.z)
+        x, y, z = self._components(other)
+        return Vec3(self.x - x, self.y - y, self.z - z)
+
+    def __isub__(self, other: Union['Vec3', Vector, Iterable]) -> 'Vec3':
+        """Subtracts other component-wise in place."""
+        if other.__class__ is not Vec3:
+            other = Vec3(*self._components(other))
+        self.x -= other.x
+        self.y -= other.y
+        self.z -= other.z
+        return self
+
+    def __mul__(self, other: Union[Number, 'Vec3', Vector, Iterable]) -> Union['Vec3', Number]:
+        """Scalar multiplication, or the dot product with a vector operand."""
+        if isinstance(other, (int, float)):
+            return Vec3(self.x * other, self.y * other, self.z * other)
+        if other.__class__ is Vec3:
+            return self.x * other.x + self.y * other.y + self.z * other.z
+        x, y, z = self._components(other)
+        return self.x * x + self.y * y + self.z * z
+
+    def __rmul__(self, other: Number) -> Union['Vec3', Number]:
+        """Supports scalar multiplication from the left-hand side."""
+        return self.__mul__(other)
+
+    def __imul__(self, scalar: Number) -> 'Vec3':
+        """Multiplies every component by a scalar in place."""
+        if not isinstance(scalar, (int, float)):
+            return NotImplemented
+        self.x *= scalar
+        self.y *= scalar
+        self.z *= scalar
+        return self
+
+    def __truediv__(self, scalar: Number) -> 'Vec3':
+        """Returns the vector divided by a scalar."""
+        self._check_scalar(scalar)
+        return Vec3(self.x / scalar, self.y / scalar, self.z / scalar)
+
+    def __itruediv__(self, scalar: Number) -> 'Vec3':
+        """Divides every component by a scalar in place."""
+        self._check_scalar(scalar)
+        self.x /= scalar
+        self.y /= scalar
+        self.z /= scalar
+        return self
+
+    def __floordiv__(self, scalar: Number) -> 'Vec3':
+        """Returns the vector floor divided by a scalar."""
+        self._check_scalar(scalar)
+        return Vec3(self.x // scalar, self.y // scalar, self.z // scalar)
+
+    def __ifloordiv__(self, scalar: Number) -> 'Vec3':
+        """Floor divides every component by a scalar in place."""
+        self._check_scalar(scalar)
+        self.x //= scalar
+        self.y //= scalar
+        self.z //= scalar
+        return self
+
+    def __neg__(self) -> 'Vec3':
+        """Returns the negated vector."""
+        return Vec3(-self.x, -self.y, -self.z)
+
+    def __abs__(self) -> float:
+        """Returns the Euclidean norm."""
+        return (self.x ** 2 + self.y ** 2 + self.z ** 2) ** 0.5
+
+    def cross(self, other: Union['Vec3', Vector, Iterable]) -> 'Vec3':
+        """Returns the cross product self x other."""
+        if other.__class__ is Vec3:
+            x, y, z = other.x, other.y, other.z
+        else:
+            x, y, z = self._components(other)
+        return Vec3(self.y * z - self.z * y, self.z * x - self.x * z, self.x * y - self.y * x)
+
+class Vec4(_SmallVector):
+    """A four-dimensional vector (x, y, z, w)."""
+
+    __slots__ = ('x', 'y', 'z', 'w')
+    _dim = 4
+
+    def __init__(self, x: Number = 0, y: Number = 0, z: Number = 0, w: Number = 0) -> None:
+        """
+        Constructs the vector (x, y, z, w).
+
+        :param x: The first component.
+        :param y: The second component.
+        :param z: The third component.
+        :param w: The fourth component.
+        """
+        self.x = x
+        self.y = y
+        self.z = z
+        self.w = w
+
+    def __iter__(self) -> Iterator[Number]:
+        """Iterates over the components."""
+        return iter((self.x, self.y, self.z, self.w))
+
+    def __add__(self, other: Union['Vec4', Vector, Iterable]) -> 'Vec4':
+        """Returns the component-wise sum."""
+        if other.__class__ is Vec4:
+            return Vec4(self.x + other.x, self.y + other.y, self.z + other.z, self.w + other.w)
+        x, y, z, w = self._components(other)
+        return Vec4(self.x + x, self.y + y, self.z + z, self.w + w)
+
+    def __iadd__(self, other: Union['Vec4', Vector, Iterable]) -> 'Vec4':
+        """Adds other component-wise in place."""
+        if other.__class__ is not Vec4:
+            other = Vec4(*self._components(other))
+        self.x += other.x
+        self.y += other.y
+        self.z += other.z
+        self.w += other.w
+        return self
+
+    def __sub__(self, other: Union['Vec4', Vector, Iterable]) -> 'Vec4':
+        """Returns the component-wise difference."""
+        if other.__class__ is Vec4:
+            return Vec4(self.x - other.x, self.y - other.y, self.z - other.z, self.w - other.w)
+        x, y, z, w = self._components(other)
+        return Vec4(self.x - x, self.y - y, self.z - z, self.w - w)
+
+    def __isub__(self, other: Union['Vec4', Vector, Iterable]) -> 'Vec4':
+        """Subtracts other component-wise in place."""
+        if other.__class__ is not Vec4:
+            other = Vec4(*self._components(other))
+        self.x -= other.x
+        self.y -= other.y
+        self.z -= other.z
+        self.w -= other.w
+        return self
+
+    def __mul__(self, other: Union[Number, 'Vec4', Vector, Iterable]) -> Union['Vec4', Number]:
+        """Scalar multiplication, or the dot product with a vector operand."""
+        if isinstance(other, (int, float)):
+            return Vec4(self.x * other, self.y * other, self.z * other, self.w * other)
+        if other.__class__ is Vec4:
+            return self.x * other.x + self.y * other.y + self.z * other.z + self.w * other.w
+        x, y, z, w = self._components(other)
+        return self.x * x + self.y * y + self.z * z + self.w * w
+
+    def __rmul__(self, other: Number) -> Union['Vec4', Number]:
+        """Supports scalar multiplication from the left-hand side."""
+        return self.__mul__(other)
+
+    def __imul__(self, scalar: Number) -> 'Vec4':
+        """Multiplies every component by a scalar in place."""
+        if not isinstance(scalar, (int, float)):
+            return NotImplemented
+        self.x *= scalar
+        self.y *= scalar
+        self.z *= scalar
+        self.w *= scalar
+        return self
+
+    def __truediv__(self, scalar: Number) -> 'Vec4':
+        """Returns the vector divided by a scalar."""
+        self._check_scalar(scalar)
+        return Vec4(self.x / scalar, self.y / scalar, self.z / scalar, self.w / scalar)
+
+    def __itruediv__(self, scalar: Number) -> 'Vec4':
+        """Divides every component by a scalar in place."""
+        self._check_scalar(scalar)
+        self.x /= scalar
+        self.y /= scalar
+        self.z /= scalar
+        self.w /= scalar
+        return self
+
+    def __floordiv__(self, scalar: Number) -> 'Vec4':
+        """Returns the vector floor divided by a scalar."""
+        self._check_scalar(scalar)
+        return Vec4(self.x // scalar, self.y // scalar, self.z // scalar, self.w // scalar)
+
+    def __ifloordiv__(self, scalar: Number) -> 'Vec4':
+        """Floor divides every component by a scalar in place."""
+        self._check_scalar(scalar)
+        self.x //= scalar
+        self.y //= scalar
+        self.z //= scalar
+        self.w //= scalar
+        return self
+
+    def __neg__(self) -> 'Vec4':
+        """Returns the negated vector."""
+        return Vec4(-self.x, -self.y, -self.z, -self.w)
+
+    def __abs__(self) -> float:
+        """Returns the Euclidean norm."""
+        return (self.x ** 2 + self.y ** 2 + self.z ** 2 + self.w ** 2) ** 0.5
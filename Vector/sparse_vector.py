@@ -0,0 +1,325 @@
+from array import array
+from bisect import bisect_left
+from typing import Any, Iterable, Iterator, Mapping, Optional, Union
+
+from Vector import DimensionalError, Vector
+
+Number = Union[int, float]
+
+class SparseVector:
+    """
+    An n-dimensional vector that stores only its non-zero elements, as a sorted array of
+    indices and a parallel list of values. Dot products, addition, scaling and norms run in
+    O(nnz). SparseVector interoperates with Vector: mixed operators follow the same
+    DimensionalError rules, sparse-dense sums are dense, and sparse-dense dot products only
+    touch the non-zero positions.
+    """
+
+    def __init__(self, size: int, entries: Union[Mapping[int, Number], Iterable[tuple[int, Number]]] = ()) -> None:
+        """
+        Constructs a sparse vector.
+
+        :param size: The dimension of the vector.
+        :param entries: A mapping or iterable of (index, value) pairs. Zeros are dropped.
+        """
+        if not isinstance(size, int) or size < 0:
+            raise ValueError('Size must be a non-negative integer.')
+        pairs = sorted(entries.items() if isinstance(entries, Mapping) else entries)
+        indices = array('q')
+        values: list[Number] = []
+        previous = None  # Compared with the input, not with the kept entries: zeros are dropped.
+        for index, value in pairs:
+            if index < 0 or index >= size:
+                raise IndexError('Index out of range.')
+            if index == previous:
+                raise ValueError(f'Duplicate index {index}.')
+            previous = index
+            if value != 0:
+                indices.append(index)
+                values.append(value)
+        self._size = size
+        self._indices = indices
+        self._values = values
+
+    @classmethod
+    def _from_sorted(cls, size: int, indices: array, values: list) -> 'SparseVector':
+        """Wraps already sorted, zero-free index and value storage without checks."""
+        vector = cls.__new__(cls)
+        vector._size = size
+        vector._indices = indices
+        vector._values = values
+        return vector
+
+    @classmethod
+    def from_dense(cls, dense: Union[Vector, Iterable[Number]]) -> 'SparseVector':
+        """
+        Builds a sparse vector from the non-zero elements of a Vector or iterable.
+
+        :param dense: The dense elements.
+        """
+        indices = array('q')
+        values: list[Number] = []
+        size = 0
+        for size, value in enumerate(dense, 1):
+            if value != 0:
+                indices.append(size - 1)
+                values.append(value)
+        return cls._from_sorted(size, indices, values)
+
+    def to_dense(self, typecode: Optional[str] = None) -> Vector:
+        """
+        Returns the equivalent dense Vector.
+
+        :param typecode: Storage of the result, as in the Vector constructor.
+        """
+        dense = Vector(typecode=typecode)
+        dense.extend([0] * self._size)
+        data = dense._data
+        for index, value in zip(self._indices, self._values):
+            data[index] = value
+        return dense
+
+    @property
+    def size(self) -> int:
+        """Returns the dimension of the vector."""
+        return self._size
+
+    @property
+    def nnz(self) -> int:
+        """Returns the number of stored (non-zero) elements."""
+        return len(self._values)
+
+    def items(self) -> Iterator[tuple[int, Number]]:
+        """Iterates over (index, value) pairs of the non-zero elements in index order."""
+        return zip(self._indices, self._values)
+
+    def __len__(self) -> int:
+        """Returns the dimension of the vector."""
+        return self._size
+
+    def __iter__(self) -> Iterator[Number]:
+        """Iterates over all elements, zeros included."""
+        position = 0
+        for index, value in zip(self._indices, self._values):
+            yield from (0 for _ in range(index - position))
+            yield value
+            position = index + 1
+        yield from (0 for _ in range(self._size - position))
+
+    def _locate(self, index: int) -> int:
+        """Returns the position of index in the index array, or where it would be inserted."""
+        if index < 0 or index >= self._size:
+            raise IndexError('Index out of range.')
+        return bisect_left(self._indices, index)
+
+    def __getitem__(self, index: int) -> Number:
+        """
+        Returns the element at the given index in O(log nnz).
+
+        :param index: The index of the element.
+        """
+        position = self._locate(index)
+        if position < len(self._indices) and self._indices[position] == index:
+            return self._values[position]
+        return 0
+
+    def __setitem__(self, index: int, value: Number) -> None:
+        """
+        Replaces the element at the given index. Setting a zero removes the entry.
+
+        :param index: The index of the element.
+        :param value: The new value.
+        """
+        position = self._locate(index)
+        present = position < len(self._indices) and self._indices[position] == index
+        if value == 0:
+            if present:
+                del self._indices[position]
+                del self._values[position]
+        elif present:
+            self._values[position] = value
+        else:
+            self._indices.insert(position, index)
+            self._values.insert(position, value)
+
+    def __str__(self) -> str:
+        """Returns a human-readable string representation of the non-zero elements."""
+        entries = ', '.join(f'{index}: {value}' for index, value in self.items())
+        return f'{{{entries}}} (size {self._size})'
+
+    def __repr__(self) -> str:
+        """Returns an unambiguous string representation of the vector."""
+        return f'SparseVector({self._size}, {dict(self.items())!r})'
+
+    def _check_dimension(self, other: Any) -> None:
+        """Raises the same errors as Vector._validate_operands."""
+        if not isinstance(other, (SparseVector, Vector, Iterable)):
+            raise TypeError('Operand must be a Vector or Iterable.')
+        if len(other) != self._size:
+            raise DimensionalError('Vectors have different dimensions.')
+
+    def _merge(self, other: 'SparseVector', sign: int) -> 'SparseVector':
+        """Returns self + sign * other by merging the two sorted index arrays."""
+        indices = array('q')
+        values: list[Number] = []
+        a_idx, a_val, b_idx, b_val = self._indices, self._values, other._indices, other._values
+        i = j = 0
+        while i < len(a_idx) and j < len(b_idx):
+            if a_idx[i] == b_idx[j]:
+                value = a_val[i] + b_val[j] if sign > 0 else a_val[i] - b_val[j]
+                if value != 0:
+                    indices.append(a_idx[i])
+                    values.append(value)
+                i += 1
+                j += 1
+            elif a_idx[i] < b_idx[j]:
+                indices.append(a_idx[i])
+                values.append(a_val[i])
+                i += 1
+            else:
+                indices.append(b_idx[j])
+                values.append(b_val[j] if sign > 0 else -b_val[j])
+                j += 1
+        indices.extend(a_idx[i:])
+        values.extend(a_val[i:])
+        indices.extend(b_idx[j:])
+        values.extend(b_val[j:] if sign > 0 else [-v for v in b_val[j:]])
+        return SparseVector._from_sorted(self._size, indices, values)
+
+    def _dense_combine(self, other: Union[Vector, Iterable], sign: int, reflected: bool) -> Vector:
+        """
+        Returns the dense result of self +/- other (or other +/- self when reflected). Only
+        the non-zero positions of self are touched after copying the dense operand.
+        """
+        typecode = other.typecode if isinstance(other, Vector) else None
+        if typecode == 'q' and not all(isinstance(v, int) for v in self._values):
+            typecode = 'd'
+        if typecode is None:
+            data = list(other)
+        else:
+            data = array(typecode, other._elements() if isinstance(other, Vector) else other)
+        if sign < 0 and not reflected:
+            for position in range(len(data)):
+                data[position] = -data[position]
+        for index, value in self.items():
+            if sign > 0:
+                data[index] = value + data[index] if not reflected else data[index] + value
+            elif reflected:
+                data[index] = data[index] - value
+            else:
+                data[index] = value + data[index]
+        return Vector._from_storage(data, typecode)
+
+    def __add__(self, other: Union['SparseVector', Vector, Iterable]) -> Union['SparseVector', Vector]:
+        """
+        Element-wise sum. Sparse + sparse is sparse and runs in O(nnz); sparse + dense is a
+        dense Vector.
+        """
+        self._check_dimension(other)
+        if isinstance(other, SparseVector):
+            return self._merge(other, 1)
+        return self._dense_combine(other, 1, False)
+
+    def __radd__(self, other: Union[Vector, Iterable]) -> Vector:
+        """Dense + sparse."""
+        self._check_dimension(other)
+        return self._dense_combine(other, 1, True)
+
+    def __sub__(self, other: Union['SparseVector', Vector, Iterable]) -> Union['SparseVector', Vector]:
+        """
+        Element-wise difference. Sparse - sparse is sparse and runs in O(nnz); sparse -
+        dense is a dense Vector.
+        """
+        self._check_dimension(other)
+        if isinstance(other, SparseVector):
+            return self._merge(other, -1)
+        return self._dense_combine(other, -1, False)
+
+    def __rsub__(self, other: Union[Vector, Iterable]) -> Vector:
+        """Dense - sparse."""
+        self._check_dimension(other)
+        return self._dense_combine(other, -1, True)
+
+    def dot(self, other: Union['SparseVector', Vector, Iterable]) -> Number:
+        """
+        Returns the dot product. Sparse-sparse merges the index arrays in O(nnz1 + nnz2);
+        sparse-dense reads the dense operand only at the non-zero positions.
+
+        :param other: A SparseVector, Vector or sequence of the same dimension.
+        """
+        self._check_dimension(other)
+        if isinstance(other, SparseVector):
+            total: Number = 0
+            a_idx, a_val, b_idx, b_val = self._indices, self._values, other._indices, other._values
+            i = j = 0
+            while i < len(a_idx) and j < len(b_idx):
+                if a_idx[i] == b_idx[j]:
+                    total += a_val[i] * b_val[j]
+                    i += 1
+                    j += 1
+                elif a_idx[i] < b_idx[j]:
+                    i += 1
+                else:
+                    j += 1
+            return total
+        data = other._data if isinstance(other, Vector) else (other if hasattr(other, '__getitem__') else list(other))
+        return sum(value * data[index] for index, value in zip(self._indices, self._values))
+
+    def __mul__(self, other: Union[Number, 'SparseVector', Vector, Iterable]) -> Union['SparseVector', Number]:
+        """
+        If 'other' is a number, returns the scaled sparse vector; otherwise the dot product.
+        """
+        if isinstance(other, (int, float)):
+            if other == 0:
+                return SparseVector(self._size)
+            return SparseVector._from_sorted(self._size, array('q', self._indices), [v * other for v in self._values])
+        return self.dot(other)
+
+    def __rmul__(self, other: Union[Number, Vector, Iterable]) -> Union['SparseVector', Number]:
+        """Supports scalar multiplication and dense-sparse dot products from the left."""
+        return self.__mul__(other)
+
+    def __truediv__(self, scalar: Number) -> 'SparseVector':
+        """Returns the sparse vector divided by a scalar."""
+        if not isinstance(scalar, (int, float)):
+            raise TypeError('Division requires a numeric scalar.')
+        if scalar == 0 and self._size:
+            raise ZeroDivisionError('division by zero')
+        return SparseVector._from_sorted(self._size, array('q', self._indices), [v / scalar for v in self._values])
+
+    def __neg__(self) -> 'SparseVector':
+        """Returns the negated sparse vector."""
+        return SparseVector._from_sorted(self._size, array('q', self._indices), [-v for v in self._values])
+
+    def norm(self, p: Union[int, float] = 2) -> float:
+        """
+        Returns the p-norm over the non-zero elements.
+
+        :param p: 1, 2 or float('inf').
+        """
+        if p == 1:
+            return sum(abs(v) for v in self._values)
+        if p == 2:
+            return sum(v ** 2 for v in self._values) ** 0.5
+        if p == float('inf'):
+            return max((abs(v) for v in self._values), default=0)
+        raise ValueError('Only the 1, 2 and infinity norms are supported.')
+
+    def __abs__(self) -> float:
+        """Returns the Euclidean norm of the vector."""
+        return self.norm(2)
+
+    def __eq__(self, other: Any) -> bool:
+        """Checks element-wise equality with another SparseVector or a Vector."""
+        if isinstance(other, SparseVector):
+            return self._size == other._size and self._indices == other._indices and self._values == other._values
+        if isinstance(other, Vector):
+            return len(other) == self._size and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __bool__(self) -> bool:
+        """Returns True if the vector is not empty."""
+        return self._size != 0
+
+# Vector operators hand mixed operations over to SparseVector's reflected methods.
+Vector._deferred_types += (SparseVector,)
@@ -0,0 +1,316 @@
+from array import array
+from typing import Any, Iterable, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python kernels are always available.
+    np = None
+
+Number = Union[int, float]
+
+# Below this many elements the cost of wrapping operands in ndarrays outweighs the gain.
+NUMPY_THRESHOLD = 1024
+
+# Block size of the reusable buffer that holds products in axpy and fma.
+SCRATCH_SIZE = 8192
+
+class PythonBackend:
+    """
+    Element-wise and reduction kernels over plain Python sequences. Operands are the live
+    elements of a vector (list, array.array or memoryview) or any iterable of numbers.
+    Element-wise kernels return a list.
+
+    The in-place kernels (iadd ... fma) write the first n results into dst, which may hold
+    spare slots past n, and allocate no containers.
+    """
+    name = 'python'
+
+    def add(self, a: Iterable, b: Iterable) -> Any:
+        return [x + y for x, y in zip(a, b)]
+
+    def sub(self, a: Iterable, b: Iterable) -> Any:
+        return [x - y for x, y in zip(a, b)]
+
+    def scale(self, a: Iterable, scalar: Number) -> Any:
+        return [x * scalar for x in a]
+
+    def truediv(self, a: Iterable, scalar: Number) -> Any:
+        return [x / scalar for x in a]
+
+    def floordiv(self, a: Iterable, scalar: Number) -> Any:
+        return [x // scalar for x in a]
+
+    def neg(self, a: Iterable) -> Any:
+        return [-x for x in a]
+
+    def dot(self, a: Iterable, b: Iterable) -> Number:
+        return sum(x * y for x, y in zip(a, b))
+
+    def norm(self, a: Iterable) -> float:
+        return sum(x ** 2 for x in a) ** 0.5
+
+    def materialize(self, values: Any, typed: bool) -> Union[list, array]:
+        """
+        Converts the result of an element-wise kernel into vector storage.
+
+        :param values: A kernel result.
+        :param typed: True when the caller wants an array.array if one is readily available.
+        """
+        return values
+
+    def iadd(self, dst: Any, n: int, src: Iterable) -> None:
+        for i, y in zip(range(n), src):
+            dst[i] += y
+
+    def isub(self, dst: Any, n: int, src: Iterable) -> None:
+        for i, y in zip(range(n), src):
+            dst[i] -= y
+
+    def iscale(self, dst: Any, n: int, scalar: Number) -> None:
+        for i in range(n):
+            dst[i] *= scalar
+
+    def itruediv(self, dst: Any, n: int, scalar: Number) -> None:
+        for i in range(n):
+            dst[i] /= scalar
+
+    def ifloordiv(self, dst: Any, n: int, scalar: Number) -> None:
+        for i in range(n):
+            dst[i] //= scalar
+
+    def ineg(self, dst: Any, n: int) -> None:
+        for i in range(n):
+            dst[i] = -dst[i]
+
+    def axpy(self, dst: Any, n: int, alpha: Number, x: Iterable) -> None:
+        for i, xi in zip(range(n), x):
+            dst[i] += alpha * xi
+
+    def fma(self, dst: Any, n: int, x: Iterable, y: Iterable) -> None:
+        for i, xi, yi in zip(range(n), x, y):
+            dst[i] += xi * yi
+
+class NumpyBackend(PythonBackend):
+    """
+    Routes operations on typed double storage ('d' array.array or memoryview) of at least
+    NUMPY_THRESHOLD elements through NumPy, wrapping the storage without a copy (strided
+    slice views included). Every element-wise result then involves a float, exactly as in Python. Anything
+    NumPy would treat differently (list-backed vectors whose ints must stay ints, integer
+    overflow, big integers, division by zero) falls back to the pure-Python kernels, so
+    results and exceptions stay the same. Reductions may differ from the pure-Python sum in
+    the last bits because NumPy adds pairwise.
+    """
+    name = 'numpy'
+
+    def __init__(self) -> None:
+        self._scratch = None
+
+    @staticmethod
+    def _is_double_storage(operand: Any) -> bool:
+        """Returns True for an array.array or memoryview of C doubles."""
+        if isinstance(operand, array):
+            return operand.typecode == 'd'
+        return isinstance(operand, memoryview) and operand.format == 'd'
+
+    @staticmethod
+    def _buffer(operand: Union[array, memoryview], dtype: Any, count: int = -1) -> Any:
+        """
+        Wraps typed storage without copying. Memoryviews may be strided (slice views), which
+        np.frombuffer rejects, so they go through np.asarray instead.
+        """
+        if isinstance(operand, memoryview):
+            return np.asarray(operand if count < 0 else operand[:count])
+        return np.frombuffer(operand, dtype=dtype, count=count)
+
+    @classmethod
+    def _wrap(cls, operand: Any) -> Any:
+        """Returns a float64 or int64 ndarray over operand, or None when NumPy does not apply."""
+        if isinstance(operand, (array, memoryview)):
+            fmt = operand.typecode if isinstance(operand, array) else operand.format
+            if fmt == 'd':
+                return cls._buffer(operand, np.float64)
+            if fmt == 'q':
+                return cls._buffer(operand, np.int64)
+            return None
+        if isinstance(operand, (list, tuple)):
+            try:
+                wrapped = np.asarray(operand)
+            except (ValueError, TypeError, OverflowError):
+                return None
+            return wrapped if wrapped.dtype in (np.float64, np.int64) and wrapped.ndim == 1 else None
+        return None
+
+    def _unary(self, a: Any) -> Any:
+        """Returns a float64 ndarray over typed double storage a, or None."""
+        if len(a) < NUMPY_THRESHOLD or not self._is_double_storage(a):
+            return None
+        return self._wrap(a)
+
+    def _binary(self, a: Any, b: Any) -> Any:
+        """Returns ndarrays over a and b when one of them is typed double storage."""
+        if len(a) < NUMPY_THRESHOLD or not hasattr(b, '__len__') or len(b) != len(a):
+            return None
+        if not (self._is_double_storage(a) or self._is_double_storage(b)):
+            return None
+        x, y = self._wrap(a), self._wrap(b)
+        return None if x is None or y is None else (x, y)
+
+    @staticmethod
+    def _scalar_ok(scalar: Number) -> bool:
+        """Rejects scalars whose conversion to float64 is not what Python would do."""
+        return isinstance(scalar, float) or abs(scalar) < 2 ** 53
+
+    def add(self, a: Iterable, b: Iterable) -> Any:
+        operands = self._binary(a, b)
+        return super().add(a, b) if operands is None else np.add(*operands)
+
+    def sub(self, a: Iterable, b: Iterable) -> Any:
+        operands = self._binary(a, b)
+        return super().sub(a, b) if operands is None else np.subtract(*operands)
+
+    def scale(self, a: Iterable, scalar: Number) -> Any:
+        x = self._unary(a)
+        if x is None or not self._scalar_ok(scalar):
+            return super().scale(a, scalar)
+        return x * float(scalar)
+
+    def truediv(self, a: Iterable, scalar: Number) -> Any:
+        x = self._unary(a)
+        if x is None or scalar == 0 or not self._scalar_ok(scalar):
+            return super().truediv(a, scalar)
+        return x / float(scalar)
+
+    def floordiv(self, a: Iterable, scalar: Number) -> Any:
+        x = self._unary(a)
+        if x is None or scalar == 0 or not self._scalar_ok(scalar):
+            return super().floordiv(a, scalar)
+        return np.floor_divide(x, float(scalar))
+
+    def neg(self, a: Iterable) -> Any:
+        x = self._unary(a)
+        return super().neg(a) if x is None else np.negative(x)
+
+    def dot(self, a: Iterable, b: Iterable) -> Number:
+        operands = self._binary(a, b)
+        return super().dot(a, b) if operands is None else float(np.dot(*operands))
+
+    def norm(self, a: Iterable) -> float:
+        x = self._unary(a)
+        if x is None:
+            return super().norm(a)
+        squares = float(np.dot(x, x))
+        if squares == float('inf') and np.isfinite(x).all():
+            return super().norm(a)  # Python raises OverflowError on a ** 2 here.
+        return squares ** 0.5
+
+    def materialize(self, values: Any, typed: bool) -> Union[list, array]:
+        if isinstance(values, np.ndarray):
+            return array('d', values.tobytes()) if typed else values.tolist()
+        return values
+
+    def _target(self, dst: Any, n: int) -> Any:
+        """Returns a writable float64 ndarray over the first n slots of double storage dst, or None."""
+        if n < NUMPY_THRESHOLD or not self._is_double_storage(dst):
+            return None
+        return self._buffer(dst, np.float64, n)
+
+    def _source(self, src: Any, n: int) -> Any:
+        """Returns a float64 or int64 ndarray over the first n elements of src, or None."""
+        if isinstance(src, (array, memoryview)):
+            fmt = src.typecode if isinstance(src, array) else src.format
+            dtype = {'d': np.float64, 'q': np.int64}.get(fmt)
+            return None if dtype is None else self._buffer(src, dtype, n)
+        if isinstance(src, list) and len(src) > n:
+            src = src[:n]
+        wrapped = self._wrap(src)
+        return wrapped if wrapped is not None and len(wrapped) == n else None
+
+    def iadd(self, dst: Any, n: int, src: Iterable) -> None:
+        x = self._target(dst, n)
+        y = None if x is None else self._source(src, n)
+        if y is None:
+            return super().iadd(dst, n, src)
+        np.add(x, y, out=x)
+
+    def isub(self, dst: Any, n: int, src: Iterable) -> None:
+        x = self._target(dst, n)
+        y = None if x is None else self._source(src, n)
+        if y is None:
+            return super().isub(dst, n, src)
+        np.subtract(x, y, out=x)
+
+    def iscale(self, dst: Any, n: int, scalar: Number) -> None:
+        x = self._target(dst, n)
+        if x is None or not self._scalar_ok(scalar):
+            return super().iscale(dst, n, scalar)
+        np.multiply(x, float(scalar), out=x)
+
+    def itruediv(self, dst: Any, n: int, scalar: Number) -> None:
+        x = self._target(dst, n)
+        if x is None or scalar == 0 or not self._scalar_ok(scalar):
+            return super().itruediv(dst, n, scalar)
+        np.divide(x, float(scalar), out=x)
+
+    def ifloordiv(self, dst: Any, n: int, scalar: Number) -> None:
+        x = self._target(dst, n)
+        if x is None or scalar == 0 or not self._scalar_ok(scalar):
+            return super().ifloordiv(dst, n, scalar)
+        np.floor_divide(x, float(scalar), out=x)
+
+    def ineg(self, dst: Any, n: int) -> None:
+        x = self._target(dst, n)
+        if x is None:
+            return super().ineg(dst, n)
+        np.negative(x, out=x)
+
+    def _chunks(self, n: int):
+        """Yields (start, stop, scratch) blocks; scratch is a reused float64 buffer."""
+        if self._scratch is None:
+            self._scratch = np.empty(SCRATCH_SIZE, dtype=np.float64)
+        for start in range(0, n, SCRATCH_SIZE):
+            stop = min(start + SCRATCH_SIZE, n)
+            yield start, stop, self._scratch[:stop - start]
+
+    def axpy(self, dst: Any, n: int, alpha: Number, x: Iterable) -> None:
+        target = self._target(dst, n)
+        source = None if target is None or not self._scalar_ok(alpha) else self._source(x, n)
+        # An integer alpha times integer x is exact in Python but not in float64.
+        if source is None or (source.dtype != np.float64 and not isinstance(alpha, float)):
+            return super().axpy(dst, n, alpha, x)
+        alpha = float(alpha)
+        for start, stop, scratch in self._chunks(n):
+            np.multiply(source[start:stop], alpha, out=scratch)
+            np.add(target[start:stop], scratch, out=target[start:stop])
+
+    def fma(self, dst: Any, n: int, x: Iterable, y: Iterable) -> None:
+        target = self._target(dst, n)
+        left = None if target is None else self._source(x, n)
+        right = None if left is None else self._source(y, n)
+        if right is None or np.float64 not in (left.dtype, right.dtype):
+            return super().fma(dst, n, x, y)
+        for start, stop, scratch in self._chunks(n):
+            np.multiply(left[start:stop], right[start:stop], out=scratch)
+            np.add(target[start:stop], scratch, out=target[start:stop])
+
+_BACKENDS = {'python': PythonBackend}
+if np is not None:
+    _BACKENDS['numpy'] = NumpyBackend
+
+active: PythonBackend = NumpyBackend() if np is not None else PythonBackend()
+
+def get_backend() -> str:
+    """Returns the name of the backend currently used by Vector operators."""
+    return active.name
+
+def set_backend(name: str) -> None:
+    """
+    Selects the backend used by Vector operators.
+
+    :param name: 'python', 'numpy' (requires NumPy) or 'auto' (NumPy when installed).
+    """
+    global active
+    if name == 'auto':
+        name = 'numpy' if np is not None else 'python'
+    if name not in _BACKENDS:
+        raise ValueError(f"Backend {name!r} is not available; choose from {sorted(_BACKENDS)} or 'auto'.")
+    active = _BACKENDS[name]()
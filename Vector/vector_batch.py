@@ -0,0 +1,194 @@
+from array import array
+from itertools import cycle, islice, repeat
+from operator import add, mul, sub
+from typing import Callable, Iterable, Iterator, Union
+
+from Vector import TYPECODES, DimensionalError, Vector, VectorView
+
+class VectorBatch:
+    """
+    A collection of N vectors of the same dimension D stored row-major in one contiguous
+    array.array. Row-wise arithmetic, dot products and norms run as a few tight passes over
+    the flat buffer instead of N separate Vector objects.
+    """
+
+    def __init__(self, dim: int, rows: Iterable[Union[Vector, Iterable]] = (), typecode: str = 'd') -> None:
+        """
+        Constructs a batch from an iterable of rows.
+
+        :param dim: The dimension D shared by all rows.
+        :param rows: Vectors or iterables of length dim.
+        :param typecode: 'd' (doubles) or 'q' (64-bit integers).
+        """
+        if not isinstance(dim, int) or dim < 0:
+            raise ValueError('Dimension must be a non-negative integer.')
+        if typecode not in TYPECODES:
+            raise ValueError(f"Unsupported typecode {typecode!r}; expected one of {TYPECODES}.")
+        self._dim: int = dim
+        self._typecode: str = typecode
+        self._data: array = array(typecode)
+        # Change counter shared by all row views, so that writing through one row drops
+        # the cached norms of every view (see Vector.invalidate).
+        self._epoch: list[int] = [0]
+        for row in rows:
+            self.append(row)
+
+    @classmethod
+    def from_flat(cls, dim: int, data: Iterable[Union[int, float]], typecode: str = 'd') -> 'VectorBatch':
+        """
+        Builds a batch from a flat row-major sequence of N * dim values.
+
+        :param dim: The dimension of each row.
+        :param data: The values, row after row.
+        :param typecode: 'd' (doubles) or 'q' (64-bit integers).
+        """
+        batch = cls(dim, typecode=typecode)
+        batch._data = data if isinstance(data, array) and data.typecode == typecode else array(typecode, data)
+        if len(batch._data) % dim if dim else len(batch._data):
+            raise DimensionalError(f'{len(batch._data)} values cannot be split into rows of dimension {dim}.')
+        return batch
+
+    @property
+    def dim(self) -> int:
+        """Returns the dimension of every row."""
+        return self._dim
+
+    @property
+    def typecode(self) -> str:
+        """Returns the array typecode of the storage."""
+        return self._typecode
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Returns (number of rows, dimension)."""
+        return len(self), self._dim
+
+    def data(self) -> memoryview:
+        """Returns a zero-copy memoryview over the flat row-major buffer."""
+        return memoryview(self._data)
+
+    def append(self, row: Union[Vector, Iterable]) -> None:
+        """
+        Appends a row to the batch.
+
+        :param row: A Vector or iterable of length dim.
+        """
+        values = row._elements() if isinstance(row, Vector) else list(row)
+        if len(values) != self._dim:
+            raise DimensionalError('Row has a different dimension than the batch.')
+        self._data.extend(values if isinstance(values, array) and values.typecode == self._typecode
+                          else array(self._typecode, values))
+
+    def __len__(self) -> int:
+        """Returns the number of rows."""
+        return len(self._data) // self._dim if self._dim else 0
+
+    def __getitem__(self, index: int) -> VectorView:
+        """
+        Returns a zero-copy view of a row. Writes through the view change the batch.
+        While a view is alive the batch cannot grow (array.array raises BufferError).
+
+        :param index: The row index.
+        """
+        if index < 0 or index >= len(self):
+            raise IndexError('Row index out of range.')
+        start = index * self._dim
+        return VectorView(memoryview(self._data)[start:start + self._dim], self._typecode, self)
+
+    def __iter__(self) -> Iterator[VectorView]:
+        """Iterates over row views."""
+        return (self[i] for i in range(len(self)))
+
+    def __eq__(self, other: object) -> bool:
+        """Checks whether two batches hold the same rows."""
+        if not isinstance(other, VectorBatch):
+            return False
+        return self._dim == other._dim and self._data.tolist() == other._data.tolist()
+
+    def __repr__(self) -> str:
+        """Returns an unambiguous string representation of the batch."""
+        return f"VectorBatch(rows={len(self)}, dim={self._dim}, typecode={self._typecode!r})"
+
+    def _rows(self, flat: Iterable) -> Iterator[Iterator]:
+        """Splits a flat iterable of N * dim values into per-row iterators."""
+        it = iter(flat)
+        return (islice(it, self._dim) for _ in range(len(self)))
+
+    def _pack(self, values: Iterable[Union[int, float]]) -> 'VectorBatch':
+        """
+        Wraps computed values in a new batch of the same shape. Integer storage is widened
+        to doubles when the values are not all integers.
+        """
+        if self._typecode == 'd':
+            return VectorBatch.from_flat(self._dim, array('d', values), 'd')
+        values = list(values)
+        typecode = 'q' if all(isinstance(v, int) for v in values) else 'd'
+        return VectorBatch.from_flat(self._dim, array(typecode, values), typecode)
+
+    def _broadcast(self, other: Union['VectorBatch', Vector, Iterable]) -> Iterable:
+        """
+        Returns an iterable aligned with the flat buffer: the other batch's buffer, or a
+        single row repeated once per row.
+
+        :param other: A batch of the same shape, or one row of dimension dim.
+        """
+        if isinstance(other, VectorBatch):
+            if other.shape != self.shape:
+                raise DimensionalError('Batches have different shapes.')
+            return other._data
+        if not isinstance(other, (Vector, Iterable)):
+            raise TypeError('Operand must be a VectorBatch, Vector or Iterable.')
+        row = list(other)
+        if len(row) != self._dim:
+            raise DimensionalError('Vector has a different dimension than the batch.')
+        return cycle(row)
+
+    def _elementwise(self, op: Callable, other: Union['VectorBatch', Vector, Iterable]) -> 'VectorBatch':
+        """Applies a binary operator across the flat buffer and the broadcast operand."""
+        return self._pack(map(op, self._data, self._broadcast(other)))
+
+    def __add__(self, other: Union['VectorBatch', Vector, Iterable]) -> 'VectorBatch':
+        """
+        Adds another batch row by row, or adds one vector to every row.
+
+        :param other: A batch of the same shape, or a Vector/Iterable of dimension dim.
+        """
+        return self._elementwise(add, other)
+
+    def __sub__(self, other: Union['VectorBatch', Vector, Iterable]) -> 'VectorBatch':
+        """
+        Subtracts another batch row by row, or subtracts one vector from every row.
+
+        :param other: A batch of the same shape, or a Vector/Iterable of dimension dim.
+        """
+        return self._elementwise(sub, other)
+
+    def scale(self, alpha: Union[int, float]) -> 'VectorBatch':
+        """
+        Returns a new batch with every value multiplied by alpha.
+
+        :param alpha: The scalar factor.
+        """
+        if not isinstance(alpha, (int, float)):
+            raise TypeError('Scaling requires a numeric scalar.')
+        return self._pack(map(mul, self._data, repeat(alpha)))
+
+    def __mul__(self, alpha: Union[int, float]) -> 'VectorBatch':
+        """Scalar multiplication (see scale)."""
+        return self.scale(alpha)
+
+    __rmul__ = __mul__
+
+    def dot(self, other: Union['VectorBatch', Vector, Iterable]) -> list[Union[int, float]]:
+        """
+        Returns the row-wise dot products. With a batch of the same shape, entry i is
+        self[i] * other[i] (pairwise); with a single vector, entry i is self[i] * other
+        (all-vs-one).
+
+        :param other: A batch of the same shape, or a Vector/Iterable of dimension dim.
+        """
+        return [sum(row) for row in self._rows(map(mul, self._data, self._broadcast(other)))]
+
+    def norms(self) -> list[float]:
+        """Returns the Euclidean norm of every row."""
+        return [sum(row) ** 0.5 for row in self._rows(map(mul, self._data, self._data))]
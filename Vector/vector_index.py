@@ -0,0 +1,292 @@
+import heapq
+import math
+from operator import mul
+from typing import Iterable, Optional, Union
+
+import vector_backend
+from Vector import DimensionalError, Vector
+from vector_batch import VectorBatch
+
+np = vector_backend.np
+
+METRICS = ('euclidean', 'cosine', 'dot')
+
+# Rows per block in the brute-force kernel.
+BLOCK_SIZE = 4096
+
+class VectorIndex:
+    """
+    An exact similarity-search index over a collection of same-dimension vectors.
+
+    Every vector gets an integer key (its insertion number). Queries return (key, score)
+    pairs ordered best first, with ties broken by the smaller key, exactly as a naive loop
+    over all vectors would:
+
+    - metric='euclidean': score is the distance math.dist(query, v); smallest first.
+    - metric='dot': score is query * v; largest first.
+    - metric='cosine': score is (query * v) / (|query| |v|); largest first. Zero vectors
+      score 0.0.
+
+    Euclidean queries in at most `kdtree_max_dim` dimensions use a KD-tree that skips
+    subtrees whose bounding slab is farther than the current k-th best. Higher dimensions
+    and the similarity metrics use a blocked brute-force kernel, vectorized with NumPy when
+    it is installed. Vectors added after the last build are scanned directly and deleted
+    ones are skipped, and the tree is rebuilt once enough of them accumulate.
+    """
+
+    def __init__(self, vectors: Iterable[Union[Vector, Iterable]] = (), dim: Optional[int] = None,
+                 metric: str = 'euclidean', leaf_size: int = 16, kdtree_max_dim: int = 16) -> None:
+        """
+        Builds an index.
+
+        :param vectors: The initial vectors.
+        :param dim: The dimension; taken from the first vector when omitted.
+        :param metric: 'euclidean', 'cosine' or 'dot'.
+        :param leaf_size: Maximum number of points in a KD-tree leaf.
+        :param kdtree_max_dim: Highest dimension for which the KD-tree is used.
+        """
+        if metric not in METRICS:
+            raise ValueError(f'Unknown metric {metric!r}; expected one of {METRICS}.')
+        self.metric = metric
+        self.leaf_size = leaf_size
+        self.kdtree_max_dim = kdtree_max_dim
+        self._batch: Optional[VectorBatch] = None if dim is None else VectorBatch(dim)
+        self._norms: list[float] = []
+        self._deleted: set[int] = set()
+        self._tree = None
+        self._tree_size = 0
+        self._tree_deleted = 0
+        for vector in vectors:
+            self.add(vector)
+
+    @property
+    def dim(self) -> Optional[int]:
+        """Returns the dimension of the indexed vectors (None while the index is empty)."""
+        return None if self._batch is None else self._batch.dim
+
+    def __len__(self) -> int:
+        """Returns the number of vectors that have not been removed."""
+        total = 0 if self._batch is None else len(self._batch)
+        return total - len(self._deleted)
+
+    def __contains__(self, key: int) -> bool:
+        """Checks whether key refers to a vector that has not been removed."""
+        return self._batch is not None and 0 <= key < len(self._batch) and key not in self._deleted
+
+    def _point(self, vector: Union[Vector, Iterable], create: bool = False) -> list[float]:
+        """
+        Converts a vector to a list of floats of the index dimension. While the index has
+        no dimension yet, only add() (create=True) sets it; a query accepts any length.
+        """
+        point = [float(value) for value in vector]
+        if self._batch is None:
+            if create:
+                self._batch = VectorBatch(len(point))
+            return point
+        if len(point) != self._batch.dim:
+            raise DimensionalError('Vector has a different dimension than the index.')
+        return point
+
+    def add(self, vector: Union[Vector, Iterable]) -> int:
+        """
+        Inserts a vector and returns its key.
+
+        :param vector: A Vector or iterable of the index dimension.
+        """
+        point = self._point(vector, create=True)
+        self._batch.append(point)
+        self._norms.append(math.hypot(*point))
+        return len(self._batch) - 1
+
+    def remove(self, key: int) -> None:
+        """
+        Removes the vector with the given key.
+
+        :param key: A key returned by add().
+        """
+        if key not in self:
+            raise KeyError(key)
+        self._deleted.add(key)
+
+    def __getitem__(self, key: int) -> Vector:
+        """Returns a copy of the vector stored under key."""
+        if key not in self:
+            raise KeyError(key)
+        return Vector._from_storage(self._batch[key]._elements().tolist())
+
+    def _row(self, key: int) -> memoryview:
+        """Returns the stored coordinates of key without copying."""
+        dim = self._batch.dim
+        return self._batch.data()[key * dim:(key + 1) * dim]
+
+    def _score(self, point: list[float], point_norm: float, key: int) -> float:
+        """Returns the metric score of one stored vector."""
+        if self.metric == 'euclidean':
+            return math.dist(point, self._row(key))
+        dot = sum(map(mul, point, self._row(key)))
+        if self.metric == 'dot':
+            return dot
+        denominator = point_norm * self._norms[key]
+        return dot / denominator if denominator else 0.0
+
+    def _use_tree(self) -> bool:
+        """Decides whether Euclidean queries go through the KD-tree, rebuilding it when stale."""
+        if self.metric != 'euclidean' or self._batch is None or self._batch.dim > self.kdtree_max_dim:
+            return False
+        total = len(self._batch)
+        stale = (total - self._tree_size) + (len(self._deleted) - self._tree_deleted)
+        if self._tree is None or stale > max(64, total // 4):
+            self._build()
+        return True
+
+    def _build(self) -> None:
+        """Rebuilds the KD-tree over the live vectors."""
+        keys = [key for key in range(len(self._batch)) if key not in self._deleted]
+        self._tree = self._build_node(keys)
+        self._tree_size = len(self._batch)
+        self._tree_deleted = len(self._deleted)
+
+    def _build_node(self, keys: list[int]) -> tuple:
+        """
+        Recursively splits keys at the median of the widest coordinate.
+
+        :return: ('leaf', keys) or ('split', axis, value, left, right).
+        """
+        if len(keys) <= self.leaf_size:
+            return ('leaf', keys)
+        dim = self._batch.dim
+        data = self._batch.data()
+        spreads = []
+        for axis in range(dim):
+            values = [data[key * dim + axis] for key in keys]
+            spreads.append(max(values) - min(values))
+        axis = spreads.index(max(spreads))
+        if spreads[axis] == 0:
+            return ('leaf', keys)
+        keys = sorted(keys, key=lambda key: data[key * dim + axis])
+        middle = len(keys) // 2
+        value = data[keys[middle] * dim + axis]
+        return ('split', axis, value, self._build_node(keys[:middle]),
+                self._build_node(keys[middle:]))
+
+    def _tree_search(self, point: list[float], k: Optional[int], radius: Optional[float]) -> list[tuple[int, float]]:
+        """
+        Collects the k nearest live vectors, or all within radius, from the KD-tree and the
+        vectors added since it was built.
+        """
+        best: list[tuple[float, int]] = []  # max-heap of (-distance, -key)
+
+        def offer(key: int) -> None:
+            if key in self._deleted:
+                return
+            distance = math.dist(point, self._row(key))
+            if radius is not None:
+                if distance <= radius:
+                    best.append((-distance, -key))
+            elif len(best) < k:
+                heapq.heappush(best, (-distance, -key))
+            elif (-distance, -key) > best[0]:
+                heapq.heapreplace(best, (-distance, -key))
+
+        def bound() -> float:
+            if radius is not None:
+                return radius
+            return -best[0][0] if len(best) == k else math.inf
+
+        def visit(node: tuple) -> None:
+            if node[0] == 'leaf':
+                for key in node[1]:
+                    offer(key)
+                return
+            _, axis, value, left, right = node
+            difference = point[axis] - value
+            near, far = (left, right) if difference < 0 else (right, left)
+            visit(near)
+            # Equal distances may still hide a smaller key, so only prune strictly farther slabs.
+            if abs(difference) <= bound():
+                visit(far)
+
+        if k != 0:
+            visit(self._tree)
+            for key in range(self._tree_size, len(self._batch)):
+                offer(key)
+        return sorted(((-negated_key, -negated_distance) for negated_distance, negated_key in best),
+                      key=lambda item: (item[1], item[0]))
+
+    def _brute_scores(self, point: list[float], point_norm: float) -> list[tuple[int, float]]:
+        """Scores every live vector, a block of rows at a time."""
+        total = len(self._batch)
+        if np is not None and total * self._batch.dim >= vector_backend.NUMPY_THRESHOLD:
+            matrix = np.frombuffer(self._batch.data(), dtype=np.float64).reshape(total, self._batch.dim)
+            query = np.asarray(point, dtype=np.float64)
+            norms = np.asarray(self._norms, dtype=np.float64)
+            scores = np.empty(total, dtype=np.float64)
+            for start in range(0, total, BLOCK_SIZE):
+                block = matrix[start:start + BLOCK_SIZE]
+                if self.metric == 'euclidean':
+                    scores[start:start + BLOCK_SIZE] = np.sqrt(((block - query) ** 2).sum(axis=1))
+                else:
+                    scores[start:start + BLOCK_SIZE] = block @ query
+            if self.metric == 'cosine':
+                denominators = norms * point_norm
+                scores = np.divide(scores, denominators, out=np.zeros_like(scores), where=denominators != 0)
+            return [(key, score) for key, score in enumerate(scores.tolist()) if key not in self._deleted]
+        return [(key, self._score(point, point_norm, key)) for key in range(total) if key not in self._deleted]
+
+    def _order(self, scored: Iterable[tuple[int, float]], k: Optional[int]) -> list[tuple[int, float]]:
+        """Orders (key, score) pairs best first, ties by key, keeping the first k."""
+        if self.metric == 'euclidean':
+            sort_key = lambda item: (item[1], item[0])
+        else:
+            sort_key = lambda item: (-item[1], item[0])
+        if k is None:
+            return sorted(scored, key=sort_key)
+        return heapq.nsmallest(k, scored, key=sort_key)
+
+    def query(self, vector: Union[Vector, Iterable], k: int = 1) -> list[tuple[int, float]]:
+        """
+        Returns the k best matches for vector as (key, score) pairs, best first.
+
+        :param vector: The query vector.
+        :param k: The number of results.
+        """
+        if k < 0:
+            raise ValueError('k must be non-negative.')
+        if not len(self):
+            self._point(vector)
+            return []
+        point = self._point(vector)
+        if self._use_tree():
+            return self._tree_search(point, k, None)
+        return self._order(self._brute_scores(point, math.hypot(*point)), k)
+
+    def radius_query(self, vector: Union[Vector, Iterable], radius: float) -> list[tuple[int, float]]:
+        """
+        Returns every match within the threshold as (key, score) pairs, best first. For
+        'euclidean' the distance must be at most radius; for 'cosine' and 'dot' the
+        similarity must be at least radius.
+
+        :param vector: The query vector.
+        :param radius: The distance bound or similarity threshold.
+        """
+        if not len(self):
+            self._point(vector)
+            return []
+        point = self._point(vector)
+        if self._use_tree():
+            return self._tree_search(point, None, radius)
+        scored = self._brute_scores(point, math.hypot(*point))
+        if self.metric == 'euclidean':
+            matches = [(key, score) for key, score in scored if score <= radius]
+        else:
+            matches = [(key, score) for key, score in scored if score >= radius]
+        return self._order(matches, None)
+
+    def query_batch(self, vectors: Iterable[Union[Vector, Iterable]], k: int = 1) -> list[list[tuple[int, float]]]:
+        """
+        Runs query() for every vector.
+
+        :param vectors: The query vectors.
+        :param k: The number of results per query.
+        """
+        return [self.query(vector, k) for vector in vectors]
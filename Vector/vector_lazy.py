@@ -0,0 +1,328 @@
+from array import array
+from itertools import islice, repeat
+from operator import add, floordiv, mul, neg, sub, truediv
+from typing import Any, Iterable, Iterator, Optional, Union
+
+import vector_backend
+from Vector import DimensionalError, Vector
+from vector_backend import NUMPY_THRESHOLD, NumpyBackend, np
+
+Number = Union[int, float]
+
+# Elements evaluated per block in the fused pass.
+BLOCK_SIZE = 4096
+
+# Longest chain of nested map iterators in the Python pass before a step is collected
+# into a list; each level of nesting costs C stack when an element is pulled through.
+CHAIN_LIMIT = 32
+
+# Elements per block when the pass runs on NumPy: large enough to amortize the cost of a
+# ufunc call, small enough that the scratch buffers of a step stay in cache.
+NUMPY_BLOCK_SIZE = 16384
+
+_OPERATORS = {'+': add, '-': sub, '*': mul, '/': truediv, '//': floordiv}
+
+if np is not None:
+    _UFUNCS = {add: np.add, sub: np.subtract, mul: np.multiply, truediv: np.divide,
+               floordiv: np.floor_divide, neg: np.negative}
+
+class LazyVector:
+    """
+    A deferred Vector expression. Arithmetic on a LazyVector builds an expression tree
+    instead of intermediate vectors; the tree is evaluated in a single fused pass over
+    blocks of elements the first time the result is needed (indexing, iteration,
+    printing, comparison or evaluate()). Operands are read at that moment, and the result
+    is cached afterwards.
+
+    Create one with Vector.lazy(). Python evaluates `b * 3` on a plain Vector eagerly, so
+    every operand that is scaled or divided should be lazy as well:
+
+        result = (a.lazy() + b.lazy() * 3 - c.lazy() / 2).evaluate()
+
+    When the eager operators would use NumPy for every step (NumPy backend, at least
+    NUMPY_THRESHOLD elements, every leaf typed 'd'), the pass runs ufuncs over blocks
+    into scratch buffers allocated once, and the last step writes straight into the
+    result. Otherwise each element goes through the same Python operations in the same
+    order as in the eager operators. Either way the elements equal the eager result;
+    fused dot products and norms add in blocks, so they may differ in the last bits.
+    """
+
+    def __init__(self, op: str, operands: tuple, size: int, typecode: Optional[str]) -> None:
+        """
+        Builds an expression node. Use Vector.lazy() rather than calling this directly.
+
+        :param op: 'leaf', 'neg' or one of '+', '-', '*', '/', '//'.
+        :param operands: The leaf sequence, or the child nodes and scalars.
+        :param size: The number of elements of the result.
+        :param typecode: The typecode of the leftmost leaf, which the result inherits.
+        """
+        self._op = op
+        self._operands = operands
+        self._size = size
+        self._typecode = typecode
+        self._result: Optional[Vector] = None
+
+    @classmethod
+    def leaf(cls, operand: Union[Vector, Iterable]) -> 'LazyVector':
+        """
+        Wraps a Vector or sized iterable as an expression leaf.
+
+        :param operand: The data the leaf reads on evaluation.
+        """
+        if isinstance(operand, LazyVector):
+            return operand
+        if isinstance(operand, Vector):
+            return cls('leaf', (operand,), operand.size, operand.typecode)
+        if not isinstance(operand, Iterable):
+            raise TypeError('Operand must be a Vector or Iterable.')
+        return cls('leaf', (operand,), len(operand), None)
+
+    def __len__(self) -> int:
+        """Returns the number of elements of the result."""
+        return self._size
+
+    def _combine(self, op: str, other: Union['LazyVector', Vector, Iterable]) -> 'LazyVector':
+        """Builds an element-wise node with another vector operand."""
+        other = LazyVector.leaf(other)
+        if other._size != self._size:
+            raise DimensionalError('Vectors have different dimensions.')
+        return LazyVector(op, (self, other), self._size, self._typecode)
+
+    def _with_scalar(self, op: str, scalar: Number) -> 'LazyVector':
+        """Builds an element-wise node with a scalar operand."""
+        return LazyVector(op, (self, scalar), self._size, self._typecode)
+
+    def __add__(self, other: Union['LazyVector', Vector, Iterable]) -> 'LazyVector':
+        """Deferred element-wise addition."""
+        return self._combine('+', other)
+
+    def __sub__(self, other: Union['LazyVector', Vector, Iterable]) -> 'LazyVector':
+        """Deferred element-wise subtraction."""
+        return self._combine('-', other)
+
+    def __mul__(self, other: Union[Number, 'LazyVector', Vector, Iterable]) -> Union['LazyVector', Number]:
+        """
+        Deferred scalar multiplication. With a vector operand, returns the dot product,
+        computed in one fused pass over both expressions.
+        """
+        if isinstance(other, (int, float)):
+            return self._with_scalar('*', other)
+        node = self._combine('*', other)
+        plan = node._plan()
+        if node._on_numpy(plan):
+            return sum(float(block.sum()) for block in node._numpy_blocks(plan))
+        return sum(node._kernel_map(plan))
+
+    def __rmul__(self, other: Number) -> 'LazyVector':
+        """Supports scalar multiplication from the left-hand side."""
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        return self._with_scalar('*', other)
+
+    def __truediv__(self, scalar: Number) -> 'LazyVector':
+        """Deferred division by a scalar."""
+        if not isinstance(scalar, (int, float)):
+            raise TypeError('Division requires a numeric scalar.')
+        return self._with_scalar('/', scalar)
+
+    def __floordiv__(self, scalar: Number) -> 'LazyVector':
+        """Deferred floor division by a scalar."""
+        if not isinstance(scalar, (int, float)):
+            raise TypeError('Division requires a numeric scalar.')
+        return self._with_scalar('//', scalar)
+
+    def __neg__(self) -> 'LazyVector':
+        """Deferred negation."""
+        return LazyVector('neg', (self,), self._size, self._typecode)
+
+    def __abs__(self) -> float:
+        """Returns the Euclidean norm of the expression, computed in one fused pass."""
+        plan = self._plan()
+        if self._on_numpy(plan):
+            squares = sum(float(np.dot(block, block)) for block in self._numpy_blocks(plan))
+            if squares != float('inf'):
+                return squares ** 0.5
+            # Overflow or an infinite element: the Python pass raises or returns inf as
+            # the eager norm does.
+        return sum(x ** 2 for x in self._kernel_map(plan)) ** 0.5
+
+    def _plan(self) -> tuple[list, list, int, int]:
+        """
+        Orders the tree post-order into evaluation steps, without recursion, so pipelines
+        of any depth can be evaluated. Every distinct leaf and node gets one slot, so a
+        shared operand or subexpression is read or computed once per block.
+
+        :return: (leaves, steps, number of slots, root slot). leaves are (slot, source)
+                 pairs; steps are (slot, function, left slot, right slot or None, scalar).
+        """
+        leaves: list = []
+        steps: list = []
+        slots: dict[int, int] = {}  # id(node or leaf source) -> slot
+        count = 0
+        stack: list = [(self, False)]
+        while stack:
+            node, ready = stack.pop()
+            if id(node) in slots:
+                continue
+            if node._op == 'leaf':
+                source = node._operands[0]
+                if id(source) not in slots:
+                    slots[id(source)] = count
+                    count += 1
+                    leaves.append((slots[id(source)], source))
+                slots[id(node)] = slots[id(source)]
+                continue
+            children = [operand for operand in node._operands if isinstance(operand, LazyVector)]
+            if not ready:
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(children))
+                continue
+            left = slots[id(node._operands[0])]
+            if node._op == 'neg':
+                step = (neg, left, None, None)
+            elif len(children) == 2:
+                step = (_OPERATORS[node._op], left, slots[id(node._operands[1])], None)
+            else:
+                step = (_OPERATORS[node._op], left, None, node._operands[1])
+            slots[id(node)] = count
+            steps.append((count, *step))
+            count += 1
+        return leaves, steps, count, slots[id(self)]
+
+    def _on_numpy(self, plan: tuple) -> bool:
+        """
+        Returns True when the eager operators would run every step of the plan through
+        NumPy: the NumPy backend is active, the vectors are long enough and every leaf is
+        typed double storage. Every step then works on doubles, so the ufuncs give the
+        same elements as the eager operators.
+        """
+        leaves, steps, _, _ = plan
+        if vector_backend.get_backend() != 'numpy' or self._size < NUMPY_THRESHOLD:
+            return False
+        if not all(isinstance(source, Vector) and source.typecode == 'd' for _, source in leaves):
+            return False
+        for _, function, _, right, scalar in steps:
+            if function is neg or right is not None:
+                continue
+            if not NumpyBackend._scalar_ok(scalar) or (scalar == 0 and function in (truediv, floordiv)):
+                return False  # The eager operators use Python here.
+        return True
+
+    def _numpy_blocks(self, plan: tuple, out: Any = None) -> Iterator[Any]:
+        """
+        Evaluates the expression NUMPY_BLOCK_SIZE elements at a time with ufuncs that
+        write into scratch buffers allocated once per step, and yields each block of the
+        result as a float64 ndarray. The buffers are reused, so a block is only valid
+        until the next one is requested.
+
+        :param plan: The result of _plan(), for which _on_numpy() is True.
+        :param out: A float64 ndarray of the full length that receives the result, so
+                    the last step of every block writes straight into it.
+        """
+        leaves, steps, slots, root = plan
+        sources = [(slot, NumpyBackend._wrap(source._elements())) for slot, source in leaves]
+        block_size = min(NUMPY_BLOCK_SIZE, self._size)
+        scratch = {slot: np.empty(block_size) for slot, *_ in steps if slot != root or out is None}
+        values: list = [None] * slots
+        for start in range(0, self._size, block_size):
+            stop = min(start + block_size, self._size)
+            for slot, source in sources:
+                values[slot] = source[start:stop]
+            for slot, function, left, right, scalar in steps:
+                target = out[start:stop] if slot not in scratch else scratch[slot][:stop - start]
+                if function is neg:
+                    np.negative(values[left], out=target)
+                elif right is None:
+                    _UFUNCS[function](values[left], float(scalar), out=target)
+                else:
+                    _UFUNCS[function](values[left], values[right], out=target)
+                values[slot] = target
+            if out is not None and not steps:
+                out[start:stop] = values[root]  # The expression is a single leaf.
+            yield values[root]
+
+    def _kernel_map(self, plan: Optional[tuple] = None) -> Iterator[Number]:
+        """
+        Evaluates the expression BLOCK_SIZE elements at a time in Python. Within a block
+        the steps are chained map iterators, so each element passes through the whole
+        expression without intermediate lists; only a leaf or step read by several steps
+        is collected into a list, and so is every CHAIN_LIMIT-th step of a long chain to
+        keep the nesting of the iterators shallow. No source code is generated and
+        memory does not grow with the length of the vectors.
+        """
+        leaves, steps, slots, root = plan or self._plan()
+        leaves = [(slot, iter(source._elements() if isinstance(source, Vector) else source))
+                  for slot, source in leaves]
+        uses = [0] * slots
+        for _, _, left, right, _ in steps:
+            uses[left] += 1
+            if right is not None:
+                uses[right] += 1
+        keep = [used > 1 for used in uses]
+        chained = [0] * slots  # Nested map iterators ending at a slot.
+        for slot, _, left, right, _ in steps:
+            depth = 1 + max(chained[left], 0 if right is None else chained[right])
+            keep[slot] = keep[slot] or depth >= CHAIN_LIMIT
+            chained[slot] = 0 if keep[slot] else depth
+        values: list = [None] * slots
+        for start in range(0, self._size, BLOCK_SIZE):
+            count = min(BLOCK_SIZE, self._size - start)
+            for slot, elements in leaves:
+                block = islice(elements, count)
+                values[slot] = list(block) if keep[slot] else block
+            for slot, function, left, right, scalar in steps:
+                if function is neg:
+                    block = map(neg, values[left])
+                elif right is None:
+                    block = map(function, values[left], repeat(scalar, count))
+                else:
+                    block = map(function, values[left], values[right])
+                values[slot] = list(block) if keep[slot] else block
+            yield from values[root]
+
+    def evaluate(self) -> Vector:
+        """Evaluates the expression (once) and returns the resulting Vector."""
+        if self._result is None:
+            plan = self._plan()
+            if self._on_numpy(plan):
+                result = array('d', bytes(8 * self._size))
+                for _ in self._numpy_blocks(plan, np.frombuffer(result, dtype=np.float64)):
+                    pass
+                self._result = Vector._from_storage(result, 'd')
+                return self._result
+            values = list(self._kernel_map(plan))
+            if self._typecode is None:
+                self._result = Vector._from_storage(values)
+            else:
+                typecode = self._typecode
+                if typecode == 'q' and not all(isinstance(v, int) for v in values):
+                    typecode = 'd'
+                self._result = Vector._from_storage(array(typecode, values), typecode)
+        return self._result
+
+    def __getitem__(self, index: int) -> Number:
+        """Evaluates the expression and returns the element at index."""
+        return self.evaluate()[index]
+
+    def __iter__(self) -> Iterator[Number]:
+        """Evaluates the expression and iterates over the result."""
+        return iter(self.evaluate())
+
+    def __eq__(self, other: Any) -> bool:
+        """Evaluates the expression and compares the result with a Vector or LazyVector."""
+        if isinstance(other, LazyVector):
+            other = other.evaluate()
+        return self.evaluate() == other
+
+    def __str__(self) -> str:
+        """Evaluates the expression and returns the Vector string."""
+        return str(self.evaluate())
+
+    def __repr__(self) -> str:
+        """Returns the expression tree without evaluating it."""
+        if self._op == 'leaf':
+            return f'lazy({self._operands[0]!r})'
+        if self._op == 'neg':
+            return f'(-{self._operands[0]!r})'
+        left, right = self._operands
+        return f'({left!r} {self._op} {right!r})'
@@ -0,0 +1,320 @@
+import math
+import multiprocessing
+import sys
+from array import array
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Optional, Union
+
+import vector_backend
+from Vector import DimensionalError, Vector, VectorView
+
+Number = Union[int, float]
+
+# Vectors shorter than this are handled by the ordinary serial operators.
+PARALLEL_THRESHOLD = 1_000_000
+
+# Elements per task. Chunk boundaries depend only on the length, never on the number of
+# workers, so a reduction always adds the same partial sums in the same order.
+CHUNK_SIZE = 1 << 18
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attaches to a shared block created by the parent without taking ownership of it."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Pool workers share the parent's resource tracker (ParallelExecutor starts it before
+    # the pool), so this registration is cleared when the parent unlinks the block.
+    return shared_memory.SharedMemory(name=name)
+
+def _view(block: shared_memory.SharedMemory, typecode: str, length: int) -> memoryview:
+    """Returns a typed memoryview over the first length elements of a shared block."""
+    return block.buf[:length * array(typecode).itemsize].cast(typecode)
+
+def _kernels(name: str) -> vector_backend.PythonBackend:
+    """Selects the parent's backend in a worker, so chunks run the same kernels as the serial operators."""
+    if vector_backend.get_backend() != name:
+        vector_backend.set_backend(name)
+    return vector_backend.active
+
+def _reduce_chunk(task: tuple) -> Number:
+    """
+    Worker: reduces one chunk. 'dot' sums a[i] * b[i] and 'sumsq' sums a[i] * a[i] with the
+    backend's dot kernel; 'sum' adds a[i] with math.fsum, or exactly for integers.
+    """
+    kind, backend, operands, start, stop = task
+    kernels = _kernels(backend)
+    blocks = [_attach(name) for name, _, _ in operands]
+    try:
+        views = [_view(block, typecode, length)[start:stop] for block, (_, typecode, length) in zip(blocks, operands)]
+        if kind == 'dot':
+            result = kernels.dot(views[0], views[1])
+        elif kind == 'sumsq':
+            result = kernels.dot(views[0], views[0])
+        else:
+            result = sum(views[0]) if operands[0][1] == 'q' else math.fsum(views[0])
+        for view in views:
+            view.release()
+        return result
+    finally:
+        for block in blocks:
+            block.close()
+
+def _map_chunk(task: tuple) -> None:
+    """Worker: writes op(a[i], b[i]) (or a[i] * scalar) for one chunk into the output block."""
+    kind, backend, operands, output, scalar, start, stop = task
+    kernels = _kernels(backend)
+    blocks = [_attach(name) for name, _, _ in (*operands, output)]
+    try:
+        views = [_view(block, typecode, length)[start:stop]
+                 for block, (_, typecode, length) in zip(blocks, (*operands, output))]
+        if kind == 'scale':
+            values = kernels.scale(views[0], scalar)
+        else:
+            values = getattr(kernels, kind)(views[0], views[1])
+        values = kernels.materialize(values, True)
+        if not isinstance(values, array) or values.typecode != output[1]:
+            values = array(output[1], values)
+        views[-1][:] = values
+        for view in views:
+            view.release()
+    finally:
+        for block in blocks:
+            block.close()
+
+def _contiguous(vector: Vector) -> memoryview:
+    """Returns the elements of vector as a contiguous typed memoryview, converting list storage once."""
+    if vector.typecode is not None:
+        source = vector.data()
+        return source if source.contiguous else memoryview(array(vector.typecode, source.tobytes()))
+    elements = vector._elements()
+    try:
+        return memoryview(array('q', elements))
+    except TypeError:  # A float among the elements.
+        return memoryview(array('d', elements))
+
+def _copy_to_block(source: memoryview) -> shared_memory.SharedMemory:
+    """Copies a contiguous typed memoryview into a new shared block."""
+    block = shared_memory.SharedMemory(create=True, size=max(source.nbytes, 1))
+    block.buf[:source.nbytes] = source.cast('B')
+    return block
+
+class SharedVector(VectorView):
+    """
+    A fixed-size typed vector whose elements live in a multiprocessing.shared_memory block.
+    ParallelExecutor passes the block to its workers by name, so operands kept resident
+    in a SharedVector are not copied on every call. Use it as a context manager, or call
+    close(), to free the block.
+    """
+
+    def __init__(self, vector: Vector) -> None:
+        """
+        Copies the elements of vector into a new shared block.
+        
+        :param vector: A Vector. List storage becomes 'q' when every element is an
+                       integer and 'd' otherwise.
+        """
+        source = _contiguous(vector)
+        block = _copy_to_block(source)
+        super().__init__(_view(block, source.format, len(source)), source.format, block)
+        self._closed = False
+
+    def close(self) -> None:
+        """Frees the shared block. The vector must not be used afterwards."""
+        if self._closed:
+            return
+        self._closed = True
+        self._data.release()
+        self._base.close()
+        self._base.unlink()
+
+    def __enter__(self) -> 'SharedVector':
+        """Returns the shared vector itself."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Frees the shared block."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """Returns an unambiguous string representation of the shared vector."""
+        return 'SharedVector' + Vector.__repr__(self)[len('Vector'):]
+
+class ParallelExecutor:
+    """
+    Splits reductions and element-wise operations on very large vectors into fixed-size
+    chunks and runs them on a multiprocessing pool. Workers attach to
+    multiprocessing.shared_memory blocks by name, so no element data is pickled: a
+    SharedVector operand is used where it is, anything else is copied into a block once
+    per call (list storage is converted to 'q' or 'd' on the way). Each chunk runs
+    through the active vector_backend kernels, so list-backed and integer vectors get
+    the NumPy kernels in the workers.
+
+    The serial operators are used below `threshold` elements, and also whenever they
+    already run the operands through NumPy (typed double storage with the NumPy
+    backend): those kernels are limited by memory bandwidth, not by one core, and
+    splitting them across processes only adds copying and dispatch.
+
+    Floating-point reductions combine the chunk results with math.fsum, and chunk
+    boundaries depend only on the length, so the result does not depend on the number of
+    workers or on task completion order. Integer reductions are exact.
+
+        with ParallelExecutor(workers=8) as executor:
+            executor.dot(a, b)
+    """
+
+    def __init__(self, workers: Optional[int] = None, threshold: int = PARALLEL_THRESHOLD,
+                 chunk_size: int = CHUNK_SIZE) -> None:
+        """
+        Starts the worker pool.
+
+        :param workers: Number of processes (default: os.cpu_count()).
+        :param threshold: Minimum length for the parallel path.
+        :param chunk_size: Elements per task.
+        """
+        if chunk_size <= 0:
+            raise ValueError('Chunk size must be positive.')
+        self.threshold = threshold
+        self.chunk_size = chunk_size
+        # Start the resource tracker first so that the workers share it (see _attach).
+        resource_tracker.ensure_running()
+        self._pool = multiprocessing.Pool(workers)
+
+    def close(self) -> None:
+        """Stops the worker pool."""
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self) -> 'ParallelExecutor':
+        """Returns the executor itself."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stops the worker pool."""
+        self.close()
+
+    def _chunks(self, length: int) -> list[tuple[int, int]]:
+        """Returns the (start, stop) ranges covering length elements."""
+        return [(start, min(start + self.chunk_size, length)) for start in range(0, length, self.chunk_size)]
+
+    def _serial(self, *vectors: Vector) -> bool:
+        """Returns True when the serial operators are the faster choice for vectors (see the class docstring)."""
+        if len(vectors[0]) < self.threshold:
+            return True
+        return vector_backend.get_backend() == 'numpy' and any(vector.typecode == 'd' for vector in vectors)
+
+    @staticmethod
+    def _share(vector: Vector) -> tuple[Optional[shared_memory.SharedMemory], tuple[str, str, int]]:
+        """
+        Makes the elements of vector available to the workers.
+
+        :return: The block created for this call (None for a SharedVector, whose own block
+                 is used) and the (name, typecode, length) descriptor sent to workers.
+        """
+        if isinstance(vector, SharedVector):
+            return None, (vector._base.name, vector.typecode, len(vector))
+        source = _contiguous(vector)
+        block = _copy_to_block(source)
+        return block, (block.name, source.format, len(source))
+
+    @staticmethod
+    def _release(blocks: list[shared_memory.SharedMemory]) -> None:
+        """Closes and unlinks shared blocks created by the parent."""
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    @staticmethod
+    def _check(a: Vector, b: Vector) -> None:
+        """Applies the operand rules of Vector._validate_operands."""
+        if not isinstance(a, Vector) or not isinstance(b, Vector):
+            raise TypeError('Parallel operations require Vector operands.')
+        if a.size != b.size:
+            raise DimensionalError('Vectors have different dimensions.')
+
+    def _reduce(self, kind: str, *vectors: Vector) -> Number:
+        """Shares the operands, reduces every chunk on the pool and combines the results."""
+        blocks, operands = [], []
+        try:
+            for vector in vectors:
+                block, descriptor = self._share(vector)
+                if block is not None:
+                    blocks.append(block)
+                operands.append(descriptor)
+            backend = vector_backend.get_backend()
+            tasks = [(kind, backend, operands, start, stop) for start, stop in self._chunks(len(vectors[0]))]
+            partials = self._pool.map(_reduce_chunk, tasks)
+        finally:
+            self._release(blocks)
+        if all(typecode == 'q' for _, typecode, _ in operands):
+            return sum(partials)
+        return math.fsum(partials)
+
+    def _map(self, kind: str, a: Vector, b: Optional[Vector] = None, scalar: Number = 0) -> Vector:
+        """Shares the operands, fills a shared output block chunk by chunk and copies it out."""
+        vectors = [a] if b is None else [a, b]
+        blocks, operands = [], []
+        try:
+            for vector in vectors:
+                block, descriptor = self._share(vector)
+                if block is not None:
+                    blocks.append(block)
+                operands.append(descriptor)
+            exact = all(typecode == 'q' for _, typecode, _ in operands) and isinstance(scalar, int)
+            typecode = 'q' if exact else 'd'
+            length = len(a)
+            output_block = shared_memory.SharedMemory(create=True, size=max(length * 8, 1))
+            blocks.append(output_block)
+            output = (output_block.name, typecode, length)
+            backend = vector_backend.get_backend()
+            tasks = [(kind, backend, operands, output, scalar, start, stop) for start, stop in self._chunks(length)]
+            self._pool.map(_map_chunk, tasks)
+            result = array(typecode)
+            result.frombytes(output_block.buf[:length * 8])
+        finally:
+            self._release(blocks)
+        return Vector._from_storage(result, typecode)
+
+    def dot(self, a: Vector, b: Vector) -> Number:
+        """
+        Returns the dot product of a and b.
+
+        :param a: A Vector.
+        :param b: A Vector of the same dimension.
+        """
+        self._check(a, b)
+        if self._serial(a, b):
+            return a * b
+        return self._reduce('dot', a, b)
+
+    def norm(self, a: Vector) -> float:
+        """Returns the Euclidean norm of a."""
+        if self._serial(a):
+            return abs(a)
+        return self._reduce('sumsq', a) ** 0.5
+
+    def sum(self, a: Vector) -> Number:
+        """Returns the sum of the elements of a."""
+        if len(a) < self.threshold:
+            return sum(a)
+        return self._reduce('sum', a)
+
+    def add(self, a: Vector, b: Vector) -> Vector:
+        """Returns a + b as a typed Vector."""
+        self._check(a, b)
+        if self._serial(a, b):
+            return a + b
+        return self._map('add', a, b)
+
+    def sub(self, a: Vector, b: Vector) -> Vector:
+        """Returns a - b as a typed Vector."""
+        self._check(a, b)
+        if self._serial(a, b):
+            return a - b
+        return self._map('sub', a, b)
+
+    def scale(self, a: Vector, scalar: Number) -> Vector:
+        """Returns a * scalar as a typed Vector."""
+        if not isinstance(scalar, (int, float)):
+            raise TypeError('Scaling requires a numeric scalar.')
+        if self._serial(a):
+            return a * scalar
+        return self._map('scale', a, scalar=scalar)